@@ -0,0 +1,10 @@
+"""
+Benchmarks for the URI-Form encoded serialization library.
+The suite runs on its own, without pytest:
+
+    python -m benchmarks run --output base.json
+    python -m benchmarks compare base.json head.json
+
+Payload generators live in payloads.py and the round trip model in models.py. The bench_*.py
+modules are focused micro benchmarks run with ``python -m benchmarks.bench_<name>``.
+"""
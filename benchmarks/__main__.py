@@ -0,0 +1,102 @@
+"""Runs the benchmark suite and compares saved results.
+
+Usage:
+    python -m benchmarks run [--output results.json] [--filter parse.] [--quick]
+    python -m benchmarks compare base.json head.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from .harness import measure
+from .suite import select
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _key(result: Dict[str, Any]) -> str:
+    params = ",".join(f"{key}={value}" for key, value in sorted(result["params"].items()))
+    return f"{result['name']}[{params}]"
+
+
+def run(args: argparse.Namespace) -> None:
+    results: List[Dict[str, Any]] = []
+    print(f"{'benchmark':<72} {'ops/s':>12} {'MB/s':>9} {'peak KB':>9}")
+    for scenario in select(args.filter, args.quick):
+        operation, payload_bytes = scenario.build(**scenario.params)
+        result = measure(
+            scenario.name, operation, payload_bytes, scenario.params, repeat=args.repeat
+        ).to_dict()
+        results.append(result)
+        print(
+            f"{_key(result):<72} {result['ops_per_sec']:>12,.1f} "
+            f"{result['bytes_per_sec'] / 1e6:>9.2f} {result['peak_alloc_bytes'] / 1024:>9.1f}"
+        )
+    if args.output:
+        document = {
+            "meta": {
+                "commit": _commit(),
+                "python": sys.version,
+                "platform": platform.platform(),
+                "created": datetime.now(timezone.utc).isoformat(),
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(document, output, indent=2)
+        print(f"Saved {len(results)} results to {args.output}")
+
+
+def compare(args: argparse.Namespace) -> None:
+    documents = []
+    for path in (args.base, args.head):
+        with open(path, encoding="utf-8") as source:
+            documents.append({_key(result): result for result in json.load(source)["results"]})
+    base, head = documents
+    print(f"{'benchmark':<72} {'base ops/s':>12} {'head ops/s':>12} {'change':>8} {'peak':>8}")
+    for key, head_result in head.items():
+        base_result = base.get(key)
+        if base_result is None:
+            continue
+        speed = head_result["ops_per_sec"] / base_result["ops_per_sec"] - 1
+        peak = (head_result["peak_alloc_bytes"] + 1) / (base_result["peak_alloc_bytes"] + 1) - 1
+        print(
+            f"{key:<72} {base_result['ops_per_sec']:>12,.1f} {head_result['ops_per_sec']:>12,.1f} "
+            f"{speed:>+8.1%} {peak:>+8.1%}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.split("\n")[0]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--output", help="path of the JSON file to save results to")
+    run_parser.add_argument("--filter", default="", help="only run benchmarks containing this text")
+    run_parser.add_argument("--quick", action="store_true", help="skip the largest payloads")
+    run_parser.add_argument("--repeat", type=int, default=5, help="timed rounds per benchmark")
+    run_parser.set_defaults(handler=run)
+    compare_parser = commands.add_parser("compare", help="compare two saved results")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.set_defaults(handler=compare)
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
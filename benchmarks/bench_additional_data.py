@@ -0,0 +1,38 @@
+"""Measures try_get_anything on typical additional data values, with and without the cache.
+
+Usage: python -m benchmarks.bench_additional_data
+"""
+import timeit
+
+from kiota_serialization_form.form_parse_node import FormParseNode
+
+VALUES = [
+    "Auditor",
+    "en-US",
+    "MeganB@M365x214355.onmicrosoft.com",
+    "true",
+    "123456789,987654321",
+    "2017-07-29T03:07:25Z",
+    "48d31887-5fad-4d73-a9f5-3c356e68a038",
+    "Contoso Ltd.",
+]
+
+NUMBER = 5_000
+
+
+def convert_all(node: FormParseNode) -> None:
+    for value in VALUES:
+        node.try_get_anything(value)
+
+
+def main() -> None:
+    node = FormParseNode("")
+    for label, cache_size in (("no cache", 0), ("cache 1024", 1024)):
+        FormParseNode.configure_additional_data_cache(cache_size)
+        seconds = min(timeit.repeat(lambda: convert_all(node), number=NUMBER, repeat=3)) / NUMBER
+        print(f"{label:<12} {seconds / len(VALUES) * 1e6:>8.2f} us per value")
+    FormParseNode.configure_additional_data_cache(0)
+
+
+if __name__ == "__main__":
+    main()
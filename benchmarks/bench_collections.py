@@ -0,0 +1,43 @@
+"""Measures get_collection_of_primitive_values on large collections of ids.
+
+Usage: python -m benchmarks.bench_collections
+"""
+import timeit
+import uuid
+from uuid import UUID
+
+from kiota_serialization_form.form_parse_node import FormParseNode
+
+SIZES = (100, 1_000, 10_000)
+
+
+def node_per_item(node: FormParseNode, primitive_type: type) -> list:
+    """Decodes each item through its own parse node, as the library used to"""
+    method_name = f"get_{primitive_type.__name__.lower()}_value"
+    return [getattr(FormParseNode(item), method_name)() for item in node._node.split(",")]
+
+
+def main() -> None:
+    print(f"{'type':<6} {'items':>7} {'node per item (ms)':>19} {'batched (ms)':>13}")
+    for primitive_type, make in ((int, str), (UUID, lambda i: str(uuid.UUID(int=i)))):
+        for size in SIZES:
+            node = FormParseNode(",".join(make(i) for i in range(size)))
+            repeat = max(1, 10_000 // size)
+            per_item = min(
+                timeit.repeat(lambda: node_per_item(node, primitive_type), number=repeat, repeat=3)
+            ) / repeat
+            batched = min(
+                timeit.repeat(
+                    lambda: node.get_collection_of_primitive_values(primitive_type),
+                    number=repeat,
+                    repeat=3
+                )
+            ) / repeat
+            print(
+                f"{primitive_type.__name__:<6} {size:>7} {per_item * 1e3:>19.3f} "
+                f"{batched * 1e3:>13.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compares the built-in ISO-8601 parser against pendulum.parse on real-world timestamp shapes.
+
+Usage: python -m benchmarks.bench_dates
+"""
+import timeit
+
+import pendulum
+
+from kiota_serialization_form._iso8601 import (
+    parse_date,
+    parse_datetime,
+    parse_time,
+    parse_timedelta,
+)
+
+CORPUS = [
+    ("datetime UTC", "2017-07-29T03:07:25Z", parse_datetime),
+    ("datetime naive fraction", "2022-01-27T12:59:45.596117", parse_datetime),
+    ("datetime 7 digit fraction", "2022-01-27T12:59:45.5961179+02:00", parse_datetime),
+    ("datetime offset", "2022-01-27T12:59:45-05:30", parse_datetime),
+    ("datetime space basic offset", "2022-01-27 12:59:45-0530", parse_datetime),
+    ("date", "2015-04-20", parse_date),
+    ("time fraction", "08:00:00.0000000", parse_time),
+    ("time", "12:59:45", parse_time),
+    ("duration hours", "PT1H", parse_timedelta),
+    ("duration full", "P1DT2H3M4.5S", parse_timedelta),
+    ("duration weeks (fallback)", "P2W", parse_timedelta),
+    ("basic date (fallback)", "20220127", parse_date),
+]
+
+NUMBER = 20_000
+
+
+def main() -> None:
+    print(f"{'shape':<30} {'pendulum (us)':>14} {'built-in (us)':>14} {'speedup':>8}")
+    for name, value, parse in CORPUS:
+        slow = min(
+            timeit.repeat(lambda: pendulum.parse(value, exact=True), number=NUMBER, repeat=3)
+        ) / NUMBER
+        fast = min(timeit.repeat(lambda: parse(value), number=NUMBER, repeat=3)) / NUMBER
+        print(f"{name:<30} {slow * 1e6:>14.2f} {fast * 1e6:>14.2f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
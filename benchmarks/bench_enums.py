@@ -0,0 +1,34 @@
+"""Measures enum lookups against a large enum such as a list of permission scopes.
+
+Usage: python -m benchmarks.bench_enums
+"""
+import timeit
+from enum import Enum
+
+from kiota_serialization_form.form_parse_node import FormParseNode
+
+Scope = Enum("Scope", {f"Scope{i}": f"scope.{i}.readwrite" for i in range(500)})
+
+SINGLE = "scope.250.readwrite"
+MULTIPLE = ",".join(f"scope.{i}.readwrite" for i in range(0, 500, 5))
+
+NUMBER = 2_000
+
+
+def main() -> None:
+    single = min(
+        timeit.repeat(lambda: FormParseNode(SINGLE).get_enum_value(Scope), number=NUMBER, repeat=3)
+    ) / NUMBER
+    collection = min(
+        timeit.repeat(
+            lambda: FormParseNode(MULTIPLE).get_collection_of_enum_values(Scope),
+            number=NUMBER // 10,
+            repeat=3
+        )
+    ) / (NUMBER // 10)
+    print(f"single value of 500:      {single * 1e6:>10.2f} us")
+    print(f"collection of 100 of 500: {collection * 1e6:>10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Reports the memory held per parsed body and per writer kept alive, e.g. in a queue buffer.
+
+Usage: python -m benchmarks.bench_memory
+"""
+import gc
+import tracemalloc
+from typing import Any, Callable, List
+
+from kiota_serialization_form.form_parse_node_factory import FormParseNodeFactory
+from kiota_serialization_form.form_serialization_writer_factory import (
+    FormSerializationWriterFactory,
+)
+
+from .payloads import form_body
+
+CONTENT_TYPE = "application/x-www-form-urlencoded"
+COUNT = 20_000
+
+
+def held_bytes(build: Callable[[int], Any]) -> float:
+    """Returns the traced bytes retained per object built, excluding the payloads"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    held: List[Any] = [build(index) for index in range(COUNT)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return (after - before) / COUNT
+
+
+def main() -> None:
+    parse_node_factory = FormParseNodeFactory()
+    writer_factory = FormSerializationWriterFactory()
+    for field_count in (5, 20):
+        bodies = [form_body(field_count=field_count, seed=seed) for seed in range(COUNT)]
+
+        def parse(index: int) -> Any:
+            root = parse_node_factory.get_root_parse_node(CONTENT_TYPE, bodies[index])
+            root.get_child_node("field0")  # splits the field table
+            return root
+
+        print(f"parsed body, {field_count:>2} fields: {held_bytes(parse):>8,.0f} bytes")
+    writer = lambda _: writer_factory.get_serialization_writer(CONTENT_TYPE)
+    print(f"empty writer:            {held_bytes(writer):>8,.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compares reading captured bodies into memory with parsing them over a memory mapped file.
+
+Usage: python -m benchmarks.bench_mmap
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from kiota_serialization_form.form_parse_node_factory import FormParseNodeFactory
+
+from .models import BenchmarkEntity
+from .payloads import entity_body, form_body
+
+CONTENT_TYPE = "application/x-www-form-urlencoded"
+BODIES = 20_000
+WIDE_FIELDS = 200_000
+
+
+def run(label: str, operation: Callable[[], Any]) -> None:
+    started = time.perf_counter()
+    operation()
+    elapsed = time.perf_counter() - started
+    # Traced separately as tracing slows parsing down several times
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed * 1e3:>9.1f} ms  peak {peak / 1e6:>7.1f} MB")
+
+
+def main() -> None:
+    factory = FormParseNodeFactory()
+    with tempfile.TemporaryDirectory() as directory:
+        bodies_path = os.path.join(directory, "bodies.form")
+        samples = [entity_body(seed, additional_fields=5) for seed in range(100)]
+        with open(bodies_path, "wb") as file:
+            for index in range(BODIES):
+                file.write(samples[index % len(samples)] + b"\n")
+        wide_path = os.path.join(directory, "wide.form")
+        with open(wide_path, "wb") as file:
+            file.write(form_body(field_count=WIDE_FIELDS, value_length=64))
+        for path in (bodies_path, wide_path):
+            print(f"{os.path.basename(path)}: {os.path.getsize(path) / 1e6:.1f} MB")
+
+        def read_bodies() -> None:
+            with open(bodies_path, "rb") as file:
+                for line in file.read().splitlines():
+                    factory.get_root_parse_node(CONTENT_TYPE,
+                                                line).get_object_value(BenchmarkEntity)
+
+        def map_bodies() -> None:
+            for root in factory.iter_root_parse_nodes_from_file(CONTENT_TYPE, bodies_path):
+                root.get_object_value(BenchmarkEntity)
+
+        def read_wide() -> None:
+            with open(wide_path, "rb") as file:
+                root = factory.get_root_parse_node(CONTENT_TYPE, file.read())
+            root.get_child_node("field0")
+
+        def map_wide() -> None:
+            factory.get_root_parse_node_from_file(CONTENT_TYPE, wide_path).get_child_node("field0")
+
+        run("bodies, read into bytes", read_bodies)
+        run("bodies, memory mapped", map_bodies)
+        run("wide body, read into bytes", read_wide)
+        run("wide body, memory mapped", map_wide)
+
+
+if __name__ == "__main__":
+    main()
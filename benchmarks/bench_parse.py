@@ -0,0 +1,40 @@
+"""Measures FormParseNode field lookups on wide bodies and per-field leaf reads.
+
+Usage: python -m benchmarks.bench_parse
+"""
+import timeit
+
+from kiota_serialization_form.form_parse_node import FormParseNode
+
+FIELD_COUNTS = (10, 100, 1_000, 10_000)
+
+
+def make_body(count: int) -> str:
+    return "&".join(f"field{i}=value+{i}%21" for i in range(count))
+
+
+def read_fields(body: str, count: int) -> None:
+    root = FormParseNode(body)
+    for i in range(0, count, max(1, count // 10)):
+        child = root.get_child_node(f"field{i}")
+        if child is not None:
+            child.get_str_value()
+
+
+def read_leaves(count: int) -> None:
+    for i in range(count):
+        FormParseNode(str(i)).get_int_value()
+
+
+def main() -> None:
+    print(f"{'fields':>8} {'root (ms)':>12} {'leaves (ms)':>12}")
+    for count in FIELD_COUNTS:
+        body = make_body(count)
+        repeat = max(1, 10_000 // count)
+        root = min(timeit.repeat(lambda: read_fields(body, count), number=repeat, repeat=3))
+        leaves = min(timeit.repeat(lambda: read_leaves(count), number=repeat, repeat=3))
+        print(f"{count:>8} {root / repeat * 1e3:>12.3f} {leaves / repeat * 1e3:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
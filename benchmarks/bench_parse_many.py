@@ -0,0 +1,44 @@
+"""Compares parse_many with parsing each body through get_root_parse_node.
+
+Usage: python -m benchmarks.bench_parse_many
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from kiota_serialization_form.form_parse_node_factory import FormParseNodeFactory
+
+from .models import BenchmarkEntity
+from .payloads import entity_body
+
+CONTENT_TYPE = "application/x-www-form-urlencoded"
+BODIES = 10_000
+BATCH_SIZE = 500
+
+
+def one_by_one(bodies: list) -> None:
+    factory = FormParseNodeFactory()
+    for body in bodies:
+        factory.get_root_parse_node(CONTENT_TYPE, body).get_object_value(BenchmarkEntity)
+
+
+def main() -> None:
+    bodies = [entity_body(seed, additional_fields=5) for seed in range(BODIES)]
+    factory = FormParseNodeFactory()
+    started = time.perf_counter()
+    one_by_one(bodies)
+    print(f"one by one:         {BODIES / (time.perf_counter() - started):>9,.0f} bodies/s")
+    started = time.perf_counter()
+    factory.parse_many(CONTENT_TYPE, bodies, BenchmarkEntity, batch_size=BATCH_SIZE)
+    print(f"parse_many:         {BODIES / (time.perf_counter() - started):>9,.0f} bodies/s")
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        factory.parse_many(CONTENT_TYPE, bodies[:BATCH_SIZE], BenchmarkEntity, executor)
+        started = time.perf_counter()
+        factory.parse_many(CONTENT_TYPE, bodies, BenchmarkEntity, executor, BATCH_SIZE)
+        elapsed = time.perf_counter() - started
+    print(f"parse_many x{workers:<3}     {BODIES / elapsed:>9,.0f} bodies/s")
+
+
+if __name__ == "__main__":
+    main()
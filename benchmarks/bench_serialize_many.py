@@ -0,0 +1,44 @@
+"""Measures serialize_many throughput sequentially and across process pools of growing size.
+
+Usage: python -m benchmarks.bench_serialize_many
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from kiota_serialization_form.form_serialization_writer_factory import (
+    FormSerializationWriterFactory,
+)
+
+from .payloads import make_entity
+
+CONTENT_TYPE = "application/x-www-form-urlencoded"
+MODELS = 20_000
+BATCH_SIZE = 500
+
+
+def run(models: list, executor: Optional[ProcessPoolExecutor]) -> float:
+    factory = FormSerializationWriterFactory()
+    started = time.perf_counter()
+    for _ in factory.serialize_many(CONTENT_TYPE, models, executor, BATCH_SIZE):
+        pass
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    models = [make_entity(seed, additional_fields=5) for seed in range(MODELS)]
+    sequential = run(models, None)
+    print(f"{'workers':>8} {'models/s':>10} {'speedup':>8}")
+    print(f"{'-':>8} {MODELS / sequential:>10,.0f} {1:>7.2f}x")
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            run(models[:BATCH_SIZE * workers], executor)  # start the workers
+            elapsed = run(models, executor)
+        print(f"{workers:>8} {MODELS / elapsed:>10,.0f} {sequential / elapsed:>7.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compares peak memory of a buffered body, a body streamed while its fields are written and a
+model written into the body and then streamed.
+
+Usage: python -m benchmarks.bench_streaming
+"""
+import os
+import time
+import tracemalloc
+from typing import Callable
+
+from kiota_abstractions.serialization import Parsable
+
+from kiota_serialization_form.form_serialization_writer import FormSerializationWriter
+
+FIELDS = 200
+ATTACHMENT = os.urandom(64 * 1024)
+
+
+def buffered() -> int:
+    writer = FormSerializationWriter()
+    for i in range(FIELDS):
+        writer.write_bytes_value(f"attachment{i}", ATTACHMENT)
+    return len(writer.get_serialized_content())
+
+
+def streamed() -> int:
+    writer = FormSerializationWriter()
+    sent = 0
+    for i in range(FIELDS):
+        writer.write_bytes_value(f"attachment{i}", ATTACHMENT)
+        for chunk in writer.iter_serialized_content():
+            sent += len(chunk)
+    return sent
+
+
+class Attachments(Parsable):
+
+    def get_field_deserializers(self):
+        return {}
+
+    def serialize(self, writer) -> None:
+        for i in range(FIELDS):
+            writer.write_bytes_value(f"attachment{i}", ATTACHMENT)
+
+
+def model() -> int:
+    writer = FormSerializationWriter()
+    writer.write_object_value(None, Attachments())
+    return sum(len(chunk) for chunk in writer.iter_serialized_content())
+
+
+def run(label: str, produce: Callable[[], int]) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = produce()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<9} {size / 1e6:>6.1f} MB body {elapsed * 1e3:>8.1f} ms  peak {peak / 1e6:>6.1f} MB"
+    )
+
+
+def main() -> None:
+    run("buffered", buffered)
+    run("streamed", streamed)
+    run("model", model)
+
+
+if __name__ == "__main__":
+    main()
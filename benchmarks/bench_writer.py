@@ -0,0 +1,53 @@
+"""Measures how FormSerializationWriter scales with the number of written fields and the cost of
+writing additional data through write_any_value.
+
+Usage: python -m benchmarks.bench_writer
+"""
+import timeit
+from datetime import date
+from uuid import UUID
+
+import pendulum
+
+from kiota_serialization_form.form_serialization_writer import FormSerializationWriter
+
+FIELD_COUNTS = (10, 100, 1_000, 10_000, 100_000)
+
+
+def write_fields(count: int) -> bytes:
+    writer = FormSerializationWriter()
+    for i in range(count):
+        writer.write_str_value(f"field{i}", f"value {i}")
+    return writer.get_serialized_content()
+
+
+ADDITIONAL_DATA = {
+    "jobTitle": "Auditor",
+    "accountEnabled": True,
+    "intValue": 1,
+    "floatValue": 3.14,
+    "id": UUID("8f841f30-e6e3-439a-a812-ebd369559c36"),
+    "birthDay": date(2000, 9, 4),
+    "createdDateTime": pendulum.datetime(2022, 1, 27, 12, 59, 45),
+    "otherPhones": ["123456789", "987654321"],
+}
+
+
+def write_additional_data() -> bytes:
+    writer = FormSerializationWriter()
+    writer.write_additional_data_value(ADDITIONAL_DATA)
+    return writer.get_serialized_content()
+
+
+def main() -> None:
+    print(f"{'fields':>8} {'total (ms)':>12} {'per field (us)':>16}")
+    for count in FIELD_COUNTS:
+        repeat = max(1, 100_000 // count)
+        seconds = min(timeit.repeat(lambda: write_fields(count), number=repeat, repeat=3)) / repeat
+        print(f"{count:>8} {seconds * 1e3:>12.3f} {seconds / count * 1e6:>16.3f}")
+    seconds = min(timeit.repeat(write_additional_data, number=10_000, repeat=3)) / 10_000
+    print(f"additional data ({len(ADDITIONAL_DATA)} values): {seconds * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
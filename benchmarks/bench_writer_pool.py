@@ -0,0 +1,78 @@
+"""Compares the writers allocated and the peak memory of fresh and pooled writers.
+
+Usage: python -m benchmarks.bench_writer_pool
+"""
+import time
+import tracemalloc
+from typing import Any
+
+from kiota_serialization_form.form_serialization_writer import FormSerializationWriter
+from kiota_serialization_form.form_serialization_writer_factory import (
+    FormSerializationWriterFactory,
+)
+
+from .payloads import make_entity
+
+CONTENT_TYPE = "application/x-www-form-urlencoded"
+REQUESTS = 50_000
+IN_FLIGHT = 16
+
+
+def serve(factory: FormSerializationWriterFactory, entity: Any, pooled: bool) -> None:
+    in_flight = []
+    for _ in range(REQUESTS):
+        writer = factory.get_serialization_writer(CONTENT_TYPE)
+        writer.write_object_value(None, entity)
+        writer.get_serialized_content()
+        in_flight.append(writer)
+        if len(in_flight) == IN_FLIGHT:
+            if pooled:
+                for done in in_flight:
+                    factory.release_serialization_writer(done)
+            in_flight.clear()
+
+
+def count_writers(factory: FormSerializationWriterFactory, entity: Any, pooled: bool) -> int:
+    created = 0
+    original_init = FormSerializationWriter.__init__
+
+    def counting_init(self: FormSerializationWriter) -> None:
+        nonlocal created
+        created += 1
+        original_init(self)
+
+    FormSerializationWriter.__init__ = counting_init  # type: ignore[method-assign]
+    try:
+        serve(factory, entity, pooled)
+    finally:
+        FormSerializationWriter.__init__ = original_init  # type: ignore[method-assign]
+    return created
+
+
+def run(label: str, pool_size: int) -> None:
+    factory = FormSerializationWriterFactory(pool_size=pool_size)
+    entity = make_entity(additional_fields=5)
+    pooled = pool_size > 0
+    serve(factory, entity, pooled)  # fill the pool and the dispatch caches
+    started = time.perf_counter()
+    serve(factory, entity, pooled)
+    elapsed = time.perf_counter() - started
+    created = count_writers(factory, entity, pooled)
+    tracemalloc.start()
+    serve(factory, entity, pooled)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<7} {REQUESTS / elapsed:>10,.0f} requests/s  "
+        f"{created:>7,} writers allocated  peak {peak / 1e3:>7.1f} kB"
+    )
+
+
+def main() -> None:
+    print(f"{REQUESTS:,} requests, {IN_FLIGHT} in flight")
+    run("fresh", 0)
+    run("pooled", IN_FLIGHT)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Timing and allocation measurement shared by the benchmark suite."""
+from __future__ import annotations
+
+import gc
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    ops_per_sec: float
+    bytes_per_sec: float
+    mean_us: float
+    payload_bytes: int
+    peak_alloc_bytes: int
+    retained_alloc_bytes: int
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _allocations(operation: Callable[[], Any]) -> tuple:
+    """Returns the peak and retained traced bytes of a single call of the operation"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = operation()
+        after, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - before), max(0, after - before)
+
+
+def measure(
+    name: str,
+    operation: Callable[[], Any],
+    payload_bytes: int,
+    params: Dict[str, Any],
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> BenchmarkResult:
+    """Measures an operation.
+    Args:
+        name (str): the name of the benchmark.
+        operation (Callable[[], Any]): the operation to time, called without arguments.
+        payload_bytes (int): the size of the payload one call processes.
+        params (Dict[str, Any]): the parameters of the payload, stored with the result.
+        repeat (int): the number of timed rounds, the fastest round is reported.
+        min_time (float): the minimum duration of a round in seconds.
+    Returns:
+        BenchmarkResult: the measurements.
+    """
+    operation()
+    timer = timeit.Timer(operation)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    seconds = min(timer.repeat(repeat, number)) / number
+    peak, retained = _allocations(operation)
+    return BenchmarkResult(
+        name=name,
+        ops_per_sec=1 / seconds,
+        bytes_per_sec=payload_bytes / seconds,
+        mean_us=seconds * 1e6,
+        payload_bytes=payload_bytes,
+        peak_alloc_bytes=peak,
+        retained_alloc_bytes=retained,
+        params=params,
+    )
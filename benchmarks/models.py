@@ -0,0 +1,118 @@
+"""Generated-model style models used by the benchmark suite: an entity for round trips and a
+small token request serialized in high volume."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from kiota_abstractions.serialization import (
+    AdditionalDataHolder,
+    Parsable,
+    ParseNode,
+    SerializationWriter,
+)
+
+
+class BenchmarkRole(Enum):
+    Reader = "reader"
+    Writer = "writer"
+    Owner = "owner"
+    Auditor = "auditor"
+
+
+@dataclass
+class BenchmarkEntity(Parsable, AdditionalDataHolder):
+    additional_data: Dict[str, Any] = field(default_factory=dict)
+    id: Optional[UUID] = None
+    display_name: Optional[str] = None
+    account_enabled: Optional[bool] = None
+    age: Optional[int] = None
+    score: Optional[float] = None
+    roles: Optional[List[BenchmarkRole]] = None
+    device_names: Optional[List[str]] = None
+    work_duration: Optional[timedelta] = None
+    birthday: Optional[date] = None
+    start_work_time: Optional[time] = None
+    created_date_time: Optional[datetime] = None
+
+    @staticmethod
+    def create_from_discriminator_value(parse_node: Optional[ParseNode] = None) -> BenchmarkEntity:
+        if not parse_node:
+            raise TypeError("parse_node cannot be null")
+        return BenchmarkEntity()
+
+    def get_field_deserializers(self) -> Dict[str, Callable[[ParseNode], None]]:
+        return {
+            "id":
+            lambda n: setattr(self, "id", n.get_uuid_value()),
+            "displayName":
+            lambda n: setattr(self, "display_name", n.get_str_value()),
+            "accountEnabled":
+            lambda n: setattr(self, "account_enabled", n.get_bool_value()),
+            "age":
+            lambda n: setattr(self, "age", n.get_int_value()),
+            "score":
+            lambda n: setattr(self, "score", n.get_float_value()),
+            "roles":
+            lambda n: setattr(self, "roles", n.get_collection_of_enum_values(BenchmarkRole)),
+            "deviceNames":
+            lambda n: setattr(self, "device_names", n.get_collection_of_primitive_values(str)),
+            "workDuration":
+            lambda n: setattr(self, "work_duration", n.get_timedelta_value()),
+            "birthDay":
+            lambda n: setattr(self, "birthday", n.get_date_value()),
+            "startWorkTime":
+            lambda n: setattr(self, "start_work_time", n.get_time_value()),
+            "createdDateTime":
+            lambda n: setattr(self, "created_date_time", n.get_datetime_value()),
+        }
+
+    def serialize(self, writer: SerializationWriter) -> None:
+        if not writer:
+            raise TypeError("Writer cannot be null")
+        writer.write_uuid_value("id", self.id)
+        writer.write_str_value("displayName", self.display_name)
+        writer.write_bool_value("accountEnabled", self.account_enabled)
+        writer.write_int_value("age", self.age)
+        writer.write_float_value("score", self.score)
+        writer.write_collection_of_enum_values("roles", self.roles)
+        writer.write_collection_of_primitive_values("deviceNames", self.device_names)
+        writer.write_timedelta_value("workDuration", self.work_duration)
+        writer.write_date_value("birthDay", self.birthday)
+        writer.write_time_value("startWorkTime", self.start_work_time)
+        writer.write_datetime_value("createdDateTime", self.created_date_time)
+        writer.write_additional_data_value(self.additional_data)
+
+
+class TokenRequest(Parsable):
+    """An authorization code or refresh token grant, writing the fields of its grant only"""
+
+    def __init__(self, seed: int) -> None:
+        self.grant_type = "refresh_token" if seed % 4 == 0 else "authorization_code"
+        self.client_id = f"6731de76-14a6-49ae-97bc-{seed:012d}"
+        self.scope = "https://graph.microsoft.com/mail.read offline_access"
+        self.redirect_uri: Optional[str] = None
+        self.code: Optional[str] = None
+        self.code_verifier: Optional[str] = None
+        self.refresh_token: Optional[str] = None
+        if self.grant_type == "refresh_token":
+            self.refresh_token = f"OAAABAAAAiL9Kn2Z27UubvWFPbm0gLWQJVzCTE9UkP3pSx1a{seed}"
+        else:
+            self.redirect_uri = "http://localhost/myapp/"
+            self.code = f"OAAABAAAAiL9Kn2Z27UubvWFPbm0gLWQJVzCTE9UkP3pSx1aXxUjq3n8b2{seed}"
+            self.code_verifier = "ThisIsntRandomButItNeedsToBe43CharactersLong"
+
+    def get_field_deserializers(self) -> Dict[str, Callable[[ParseNode], None]]:
+        return {}
+
+    def serialize(self, writer: SerializationWriter) -> None:
+        writer.write_str_value("grant_type", self.grant_type)
+        writer.write_str_value("client_id", self.client_id)
+        writer.write_str_value("scope", self.scope)
+        writer.write_str_value("redirect_uri", self.redirect_uri)
+        writer.write_str_value("code", self.code)
+        writer.write_str_value("code_verifier", self.code_verifier)
+        writer.write_str_value("refresh_token", self.refresh_token)
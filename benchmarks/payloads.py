@@ -0,0 +1,120 @@
+"""Deterministic synthetic payloads for the benchmark suite."""
+from __future__ import annotations
+
+import random
+import string
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List
+from urllib.parse import quote_plus
+
+from .models import BenchmarkEntity, BenchmarkRole
+
+_PLAIN_CHARACTERS = string.ascii_letters + string.digits
+# Characters that quote_plus escapes, including multi byte ones
+_ESCAPED_CHARACTERS = " &=+/:%,é€"
+
+
+def _value(rng: random.Random, length: int, encoded_ratio: float) -> str:
+    return "".join(
+        rng.choice(_ESCAPED_CHARACTERS) if rng.random() <
+        encoded_ratio else rng.choice(_PLAIN_CHARACTERS) for _ in range(length)
+    )
+
+
+def _timestamp(rng: random.Random) -> str:
+    moment = datetime(2020, 1, 1, tzinfo=timezone.utc) + timedelta(
+        seconds=rng.randrange(0, 5 * 365 * 24 * 3600), microseconds=rng.randrange(0, 1_000_000)
+    )
+    return moment.isoformat()
+
+
+def form_body(
+    field_count: int = 20,
+    value_length: int = 16,
+    encoded_ratio: float = 0.0,
+    repeated_keys: int = 0,
+    date_ratio: float = 0.0,
+    seed: int = 0,
+) -> bytes:
+    """Builds a form encoded body of unknown fields.
+    Args:
+        field_count (int): the number of distinct keys.
+        value_length (int): the number of characters of each non date value before encoding.
+        encoded_ratio (float): the share of value characters that need percent encoding.
+        repeated_keys (int): the number of extra values written for each key.
+        date_ratio (float): the share of keys holding an ISO-8601 timestamp.
+        seed (int): the seed of the generator, equal arguments give equal bodies.
+    Returns:
+        bytes: the encoded body.
+    """
+    rng = random.Random(seed)
+    fields: List[str] = []
+    for index in range(field_count):
+        key = f"field{index}"
+        for _ in range(repeated_keys + 1):
+            if rng.random() < date_ratio:
+                value = _timestamp(rng)
+            else:
+                value = _value(rng, value_length, encoded_ratio)
+            fields.append(f"{key}={quote_plus(value)}")
+    return "&".join(fields).encode("utf-8")
+
+
+def make_entity(seed: int = 0, additional_fields: int = 0) -> BenchmarkEntity:
+    """Builds a fully populated BenchmarkEntity.
+    Args:
+        seed (int): the seed of the generator, equal seeds give equal entities.
+        additional_fields (int): the number of string entries in additional_data.
+    Returns:
+        BenchmarkEntity: the entity.
+    """
+    rng = random.Random(seed)
+    additional_data: Dict[str, object] = {
+        f"extension{index}": _value(rng, 12, 0.1)
+        for index in range(additional_fields)
+    }
+    return BenchmarkEntity(
+        additional_data=additional_data,
+        id=uuid.UUID(int=rng.getrandbits(128), version=4),
+        display_name=_value(rng, 24, 0.1),
+        account_enabled=rng.random() < 0.5,
+        age=rng.randrange(18, 90),
+        score=round(rng.random() * 100, 3),
+        roles=rng.sample(list(BenchmarkRole), 2),
+        device_names=[f"device{rng.randrange(1000)}" for _ in range(3)],
+        work_duration=timedelta(hours=rng.randrange(1, 10)),
+        birthday=date(1960 + rng.randrange(40), rng.randrange(1, 13), rng.randrange(1, 29)),
+        start_work_time=time(rng.randrange(6, 11), 0, 0),
+        created_date_time=datetime.fromisoformat(_timestamp(rng)),
+    )
+
+
+def entity_body(seed: int = 0, additional_fields: int = 0) -> bytes:
+    """Builds the form encoded body of a BenchmarkEntity, as a service would send it.
+    Args:
+        seed (int): the seed of the generator, equal seeds give equal bodies.
+        additional_fields (int): the number of fields the model does not declare.
+    Returns:
+        bytes: the encoded body.
+    """
+    entity = make_entity(seed, additional_fields)
+    fields = [
+        ("id", str(entity.id)),
+        ("displayName", entity.display_name or ""),
+        ("accountEnabled", str(entity.account_enabled).lower()),
+        ("age", str(entity.age)),
+        ("score", str(entity.score)),
+        ("roles", ",".join(role.value for role in entity.roles or [])),
+        *(("deviceNames", name) for name in entity.device_names or []),
+        ("workDuration", f"PT{int((entity.work_duration or timedelta()).seconds / 3600)}H"),
+        ("birthDay", str(entity.birthday)),
+        ("startWorkTime", str(entity.start_work_time)),
+        (
+            "createdDateTime",
+            entity.created_date_time.isoformat() if entity.created_date_time else ""
+        ),
+        *((key, str(value)) for key, value in entity.additional_data.items()),
+    ]
+    return "&".join(f"{quote_plus(key)}={quote_plus(value)}"
+                    for key, value in fields).encode("utf-8")
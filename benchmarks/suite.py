@@ -0,0 +1,259 @@
+"""The scenarios run by ``python -m benchmarks``."""
+from __future__ import annotations
+
+import base64
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from kiota_serialization_form.form_binary_encoding import FormBinaryEncoding
+from kiota_serialization_form.form_parse_node_factory import FormParseNodeFactory
+from kiota_serialization_form.form_serialization_writer_factory import (
+    FormSerializationWriterFactory,
+)
+from kiota_serialization_form.form_unknown_fields import CountUnknownFields
+
+from .models import BenchmarkEntity, TokenRequest
+from .payloads import entity_body, form_body, make_entity
+
+CONTENT_TYPE = "application/x-www-form-urlencoded"
+
+Operation = Tuple[Callable[[], Any], int]
+
+
+@dataclass
+class Scenario:
+    name: str
+    params: Dict[str, Any]
+    build: Callable[..., Operation]
+    quick: bool = True
+
+
+def _parse_wide(body: bytes) -> Operation:
+    factory = FormParseNodeFactory()
+    field_count = body.count(b"&") + 1
+
+    def operation() -> Any:
+        root = factory.get_root_parse_node(CONTENT_TYPE, body)
+        return [root.get_child_node(f"field{i}") for i in range(0, field_count, 10)]
+
+    return operation, len(body)
+
+
+def _parse_all(body: bytes, lazy_additional_data: bool = False) -> Operation:
+    factory = FormParseNodeFactory(lazy_additional_data=lazy_additional_data)
+
+    def operation() -> Any:
+        root = factory.get_root_parse_node(CONTENT_TYPE, body)
+        return root.get_object_value(BenchmarkEntity)
+
+    return operation, len(body)
+
+
+def _parse_fields(**params: Any) -> Operation:
+    return _parse_wide(form_body(**params))
+
+
+def _parse_additional_data(**params: Any) -> Operation:
+    return _parse_all(form_body(**params))
+
+
+def _parse_lazy_additional_data(**params: Any) -> Operation:
+    return _parse_all(form_body(**params), lazy_additional_data=True)
+
+
+def _parse_collections(**params: Any) -> Operation:
+    body = form_body(**params)
+    factory = FormParseNodeFactory()
+    field_count = params["field_count"]
+
+    def operation() -> Any:
+        root = factory.get_root_parse_node(CONTENT_TYPE, body)
+        return [
+            root.get_child_node(f"field{i}").get_collection_of_primitive_values(str)
+            for i in range(field_count)
+        ]
+
+    return operation, len(body)
+
+
+def _parse_entity(additional_fields: int) -> Operation:
+    return _parse_all(entity_body(additional_fields=additional_fields))
+
+
+def _parse_projected_entity(additional_fields: int, count_unknown_fields: bool) -> Operation:
+    body = entity_body(additional_fields=additional_fields)
+    factory = FormParseNodeFactory(
+        projection=True, unknown_fields=CountUnknownFields() if count_unknown_fields else None
+    )
+
+    def operation() -> Any:
+        root = factory.get_root_parse_node(CONTENT_TYPE, body)
+        return root.get_object_value(BenchmarkEntity)
+
+    return operation, len(body)
+
+
+def _serialize_entity(additional_fields: int) -> Operation:
+    factory = FormSerializationWriterFactory()
+    entity = make_entity(additional_fields=additional_fields)
+
+    def operation() -> bytes:
+        writer = factory.get_serialization_writer(CONTENT_TYPE)
+        writer.write_object_value(None, entity)
+        return writer.get_serialized_content()
+
+    return operation, len(operation())
+
+
+def _serialize_token_requests(requests: int, batched: bool) -> Operation:
+    factory = FormSerializationWriterFactory(pool_size=4)
+    values = [TokenRequest(seed) for seed in range(requests)]
+
+    def operation() -> List[bytes]:
+        if batched:
+            return list(factory.serialize_many(CONTENT_TYPE, values))
+        contents = []
+        for value in values:
+            writer = factory.get_serialization_writer(CONTENT_TYPE)
+            writer.write_object_value(None, value)
+            contents.append(writer.get_serialized_content())
+            factory.release_serialization_writer(writer)
+        return contents
+
+    return operation, sum(map(len, operation()))
+
+
+def _write_bytes(factory: FormSerializationWriterFactory, value: bytes) -> bytes:
+    writer = factory.get_serialization_writer(CONTENT_TYPE)
+    writer.write_str_value("name", "attachment.bin")
+    writer.write_bytes_value("content", value)
+    return writer.get_serialized_content()
+
+
+def _serialize_bytes(size_mb: int, encoding: str) -> Operation:
+    factory = FormSerializationWriterFactory(binary_encoding=FormBinaryEncoding(encoding))
+    value = os.urandom(size_mb * 1024 * 1024)
+    return lambda: _write_bytes(factory, value), size_mb * 1024 * 1024
+
+
+def _parse_bytes(size_mb: int, encoding: str) -> Operation:
+    binary_encoding = FormBinaryEncoding(encoding)
+    body = _write_bytes(
+        FormSerializationWriterFactory(binary_encoding=binary_encoding),
+        os.urandom(size_mb * 1024 * 1024)
+    )
+    factory = FormParseNodeFactory(binary_encoding=binary_encoding)
+
+    def operation() -> Any:
+        root = factory.get_root_parse_node(CONTENT_TYPE, body)
+        value = root.get_child_node("content").get_bytes_value()
+        # BASE64 reads return the base64 text, callers decode it
+        if binary_encoding is FormBinaryEncoding.BASE64:
+            return base64.b64decode(value)  # type: ignore
+        return value
+
+    return operation, size_mb * 1024 * 1024
+
+
+def _round_trip(additional_fields: int) -> Operation:
+    writer_factory = FormSerializationWriterFactory()
+    parse_node_factory = FormParseNodeFactory()
+    entity = make_entity(additional_fields=additional_fields)
+
+    def operation() -> Any:
+        writer = writer_factory.get_serialization_writer(CONTENT_TYPE)
+        entity.serialize(writer)
+        body = writer.get_serialized_content()
+        root = parse_node_factory.get_root_parse_node(CONTENT_TYPE, body)
+        return root.get_object_value(BenchmarkEntity)
+
+    writer = writer_factory.get_serialization_writer(CONTENT_TYPE)
+    entity.serialize(writer)
+    return operation, len(writer.get_serialized_content())
+
+
+def scenarios() -> Iterator[Scenario]:
+    for field_count in (10, 100, 1_000, 10_000):
+        yield Scenario(
+            "parse.lookup.fields", {"field_count": field_count}, _parse_fields, field_count < 10_000
+        )
+    for value_length in (8, 256, 4_096):
+        yield Scenario(
+            "parse.lookup.value_length", {
+                "field_count": 100,
+                "value_length": value_length
+            }, _parse_fields, value_length < 4_096
+        )
+    for encoded_ratio in (0.0, 0.25, 1.0):
+        yield Scenario(
+            "parse.lookup.encoding", {
+                "field_count": 100,
+                "value_length": 64,
+                "encoded_ratio": encoded_ratio
+            }, _parse_fields
+        )
+    for repeated_keys in (0, 10):
+        yield Scenario(
+            "parse.additional_data.repeated_keys", {
+                "field_count": 50,
+                "repeated_keys": repeated_keys
+            }, _parse_additional_data
+        )
+    # Multi-select forms, every field repeats its key once per selection
+    for field_count, selections in ((20, 5), (50, 20), (200, 50)):
+        yield Scenario(
+            "parse.collections.repeated_keys", {
+                "field_count": field_count,
+                "value_length": 8,
+                "repeated_keys": selections - 1
+            }, _parse_collections, field_count < 200
+        )
+    for date_ratio in (0.0, 1.0):
+        yield Scenario(
+            "parse.additional_data.dates", {
+                "field_count": 100,
+                "date_ratio": date_ratio
+            }, _parse_additional_data
+        )
+        yield Scenario(
+            "parse.additional_data.lazy", {
+                "field_count": 100,
+                "date_ratio": date_ratio
+            }, _parse_lazy_additional_data
+        )
+    for additional_fields in (0, 50):
+        params = {"additional_fields": additional_fields}
+        yield Scenario("parse.entity", params, _parse_entity)
+        yield Scenario("serialize.entity", params, _serialize_entity)
+        yield Scenario("round_trip.entity", params, _round_trip)
+    # A high volume of small models of a single class, through a pooled writer or in batches
+    for batched in (False, True):
+        yield Scenario(
+            "serialize.token_requests", {
+                "requests": 1_000,
+                "batched": batched
+            }, _serialize_token_requests
+        )
+    # Multi-MB attachments with each binary encoding, sizes are of the decoded value
+    for size_mb in (1, 8, 32):
+        for binary_encoding in FormBinaryEncoding:
+            params = {"size_mb": size_mb, "encoding": binary_encoding.value}
+            yield Scenario("serialize.bytes", params, _serialize_bytes, size_mb == 1)
+            yield Scenario("parse.bytes", params, _parse_bytes, size_mb == 1)
+    # Vendor forms with many fields the model does not read, compared with parse.entity
+    for additional_fields in (0, 50, 190):
+        for count_unknown_fields in (False, True):
+            yield Scenario(
+                "parse.entity.projection", {
+                    "additional_fields": additional_fields,
+                    "count_unknown_fields": count_unknown_fields
+                }, _parse_projected_entity
+            )
+
+
+def select(name_filter: str = "", quick: bool = False) -> List[Scenario]:
+    return [
+        scenario for scenario in scenarios()
+        if name_filter in scenario.name and (scenario.quick or not quick)
+    ]
@@ -0,0 +1,58 @@
+"""
+URL safe base64 without padding (RFC 4648 section 5), the alphabet of which needs no escaping in
+form encoded bodies. Values are encoded and decoded in chunks so that large binary fields are not
+copied whole between each step.
+"""
+from __future__ import annotations
+
+import string
+from binascii import a2b_base64, b2a_base64
+from typing import List, Union
+
+# Bytes encoded per chunk, a multiple of 3 so that only the last chunk is padded
+_CHUNK_SIZE = 3 * 16 * 1024
+# Characters decoded per chunk, a multiple of 4 so that chunks hold whole groups
+_ENCODED_CHUNK_SIZE = 4 * 16 * 1024
+
+_TO_URL_SAFE = bytes.maketrans(b"+/", b"-_")
+_FROM_URL_SAFE = bytes.maketrans(b"-_", b"+/")
+# The standard alphabet is accepted too, values written by other encoders decode the same
+_ALPHABET = (string.ascii_letters + string.digits + "-_+/").encode("ascii")
+# The characters of url encoded values that decode to themselves, "+" decodes to a space
+_URL_ENCODED_ALPHABET = (string.ascii_letters + string.digits + "-_/").encode("ascii")
+
+
+def append_base64url(buffer: bytearray, value: Union[bytes, bytearray, memoryview]) -> None:
+    """Appends the unpadded URL safe base64 encoding of a binary value to the buffer"""
+    view = memoryview(value).cast("B")
+    for start in range(0, len(view), _CHUNK_SIZE):
+        encoded = b2a_base64(view[start:start + _CHUNK_SIZE], newline=False)
+        buffer += encoded.rstrip(b"=").translate(_TO_URL_SAFE)
+
+
+def decode_base64url(
+    value: Union[str, bytes, bytearray, memoryview], url_encoded: bool = False
+) -> bytes:
+    """Decodes URL safe or standard base64, padded or not.
+    Raises ValueError when the value holds characters outside of the alphabets, including
+    whitespace and percent escapes, or when its length cannot be the length of an encoding.
+    Values that are still url encoded are also rejected when they hold a "+", which stands for a
+    space.
+    """
+    alphabet = _URL_ENCODED_ALPHABET if url_encoded else _ALPHABET
+    if isinstance(value, memoryview):
+        value = value.cast("B")
+    size = len(value)
+    # Padding is only valid at the end of the last chunk
+    while size and value[size - 1] in ("=", 61):
+        size -= 1
+    if size % 4 == 1:
+        raise ValueError("Invalid base64 length")
+    chunks: List[bytes] = []
+    for start in range(0, size, _ENCODED_CHUNK_SIZE):
+        chunk = value[start:min(start + _ENCODED_CHUNK_SIZE, size)]
+        encoded = chunk.encode("ascii") if isinstance(chunk, str) else bytes(chunk)
+        if encoded.translate(None, alphabet):
+            raise ValueError("Invalid base64 character")
+        chunks.append(a2b_base64(encoded.translate(_FROM_URL_SAFE) + b"=" * (-len(encoded) % 4)))
+    return b"".join(chunks)
@@ -0,0 +1,11 @@
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+def batches(values: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    """Splits values into lists of at most batch_size items, keeping their order"""
+    iterator = iter(values)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
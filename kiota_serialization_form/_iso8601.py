@@ -0,0 +1,151 @@
+"""
+Fast parsing of the common ISO-8601 shapes used by form encoded payloads.
+Values that do not match one of the shapes handled here are parsed by pendulum, so results are
+the same as calling pendulum.parse(value, exact=True) and checking the returned type.
+"""
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Dict, Optional
+
+import pendulum
+
+_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+_TIME = re.compile(r"(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?", re.ASCII)
+_DATETIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?", re.ASCII
+)
+_DURATION = re.compile(
+    r"P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)(?:\.(\d{1,6}))?S)?)?", re.ASCII
+)
+
+_TIMEZONES: Dict[str, Any] = {"Z": pendulum.UTC}
+
+
+def _microseconds(fraction: Optional[str]) -> int:
+    """Converts the digits after the decimal point to microseconds, truncating like pendulum"""
+    if not fraction:
+        return 0
+    return int(fraction[:6].ljust(6, "0"))
+
+
+def _timezone(offset: Optional[str]) -> Any:
+    """Gets the timezone for an offset designator, values without one are considered UTC"""
+    if offset is None:
+        return pendulum.UTC
+    timezone = _TIMEZONES.get(offset)
+    if timezone is None:
+        digits = offset[1:].replace(":", "")
+        seconds = int(digits[:2]) * 3600 + int(digits[2:]) * 60
+        sign = "-" if offset[0] == "-" and seconds else "+"
+        name = f"{sign}{digits[:2]}:{digits[2:]}"
+        timezone = pendulum.FixedTimezone(-seconds if sign == "-" else seconds, name=name)
+        _TIMEZONES[offset] = timezone
+    return timezone
+
+
+def _parse_with_pendulum(value: str, on_fallback: Optional[Callable[[str], None]]) -> Any:
+    """Parses the value with pendulum, returning None when it cannot be parsed"""
+    if on_fallback is not None:
+        on_fallback(value)
+    try:
+        return pendulum.parse(value, exact=True)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
+def parse_datetime(value: str,
+                   on_fallback: Optional[Callable[[str], None]] = None) -> Optional[datetime]:
+    """Parses an ISO-8601 date and time
+    Args:
+        value (str): the value to parse
+        on_fallback (Optional[Callable[[str], None]]): called with the value when it is not in a
+        shape handled here and is parsed by pendulum.
+    Returns:
+        Optional[datetime]: the parsed pendulum DateTime or None if the value is not a datetime
+    """
+    match = _DATETIME.fullmatch(value)
+    if match:
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+        try:
+            return pendulum.DateTime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                _microseconds(fraction),
+                tzinfo=_timezone(offset)
+            )
+        except ValueError:
+            pass
+    result = _parse_with_pendulum(value, on_fallback)
+    return result if isinstance(result, pendulum.DateTime) else None
+
+
+def parse_date(value: str, on_fallback: Optional[Callable[[str], None]] = None) -> Optional[date]:
+    """Parses an ISO-8601 date
+    Args:
+        value (str): the value to parse
+        on_fallback (Optional[Callable[[str], None]]): called with the value when it is not in a
+        shape handled here and is parsed by pendulum.
+    Returns:
+        Optional[date]: the parsed pendulum Date or None if the value is not a date
+    """
+    match = _DATE.fullmatch(value)
+    if match:
+        try:
+            return pendulum.Date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            pass
+    result = _parse_with_pendulum(value, on_fallback)
+    return result if isinstance(result, pendulum.Date) else None
+
+
+def parse_time(value: str, on_fallback: Optional[Callable[[str], None]] = None) -> Optional[time]:
+    """Parses an ISO-8601 time of day
+    Args:
+        value (str): the value to parse
+        on_fallback (Optional[Callable[[str], None]]): called with the value when it is not in a
+        shape handled here and is parsed by pendulum.
+    Returns:
+        Optional[time]: the parsed pendulum Time or None if the value is not a time
+    """
+    match = _TIME.fullmatch(value)
+    if match:
+        hour, minute, second, fraction = match.groups()
+        try:
+            return pendulum.Time(int(hour), int(minute), int(second), _microseconds(fraction))
+        except ValueError:
+            pass
+    result = _parse_with_pendulum(value, on_fallback)
+    return result if isinstance(result, pendulum.Time) else None
+
+
+def parse_timedelta(value: str,
+                    on_fallback: Optional[Callable[[str], None]] = None) -> Optional[timedelta]:
+    """Parses an ISO-8601 duration
+    Args:
+        value (str): the value to parse
+        on_fallback (Optional[Callable[[str], None]]): called with the value when it is not in a
+        shape handled here and is parsed by pendulum.
+    Returns:
+        Optional[timedelta]: the parsed duration or None if the value is not a duration
+    """
+    match = _DURATION.fullmatch(value)
+    if match and value != "P" and not value.endswith("T"):
+        days, hours, minutes, seconds, fraction = match.groups()
+        try:
+            return timedelta(
+                days=int(days or 0),
+                hours=int(hours or 0),
+                minutes=int(minutes or 0),
+                seconds=int(seconds or 0),
+                microseconds=_microseconds(fraction)
+            )
+        except OverflowError:
+            pass
+    result = _parse_with_pendulum(value, on_fallback)
+    return result.as_timedelta() if isinstance(result, pendulum.Duration) else None
@@ -0,0 +1,152 @@
+"""
+Additional data whose values are converted when they are first read.
+Unknown fields are kept as their raw strings when a body is parsed, most of them are never read
+and converting them runs the date and UUID parsers.
+"""
+from __future__ import annotations
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    ItemsView,
+    Iterator,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    ValuesView,
+)
+
+
+class LazyAdditionalData(Dict[str, Any]):
+    """A dict of additional data that converts each raw value on first access and keeps the
+    converted value. Membership, iteration over keys and length do not convert values and values
+    that are set are stored as they are, reading all the values at once, through items, values,
+    comparisons or consumers of dicts like json.dumps, converts the remaining raw values.
+    """
+
+    __slots__ = ("_raw_keys", "_convert")
+
+    def __init__(
+        self,
+        values: Optional[Mapping[str, Any]] = None,
+        raw_values: Optional[Mapping[str, str]] = None,
+        convert: Callable[[str], Any] = str
+    ) -> None:
+        """Creates new additional data.
+        Args:
+            values (Optional[Mapping[str, Any]]): the values that are already converted.
+            raw_values (Optional[Mapping[str, str]]): the raw values converted on first access,
+            replacing the values of the same keys.
+            convert (Callable[[str], Any]): converts a raw value.
+        """
+        super().__init__(values or ())
+        self._raw_keys: Set[str] = set()
+        self._convert = convert
+        if raw_values:
+            super().update(raw_values)
+            self._raw_keys.update(raw_values)
+
+    def _convert_all(self) -> None:
+        for key in tuple(self._raw_keys):
+            self[key]
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        if key in self._raw_keys:
+            value = self._convert(value)
+            super().__setitem__(key, value)
+            self._raw_keys.discard(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._raw_keys.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._raw_keys.discard(key)
+
+    def __iter__(self) -> Iterator[str]:
+        # Overridden so that dict(), ** unpacking and dict.update read values through __getitem__
+        # instead of copying the raw values
+        return super().__iter__()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> Tuple[str, Any]:
+        key, value = super().popitem()
+        if key in self._raw_keys:
+            self._raw_keys.discard(key)
+            value = self._convert(value)
+        return key, value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        values = dict(*args, **kwargs)
+        super().update(values)
+        self._raw_keys.difference_update(values)
+
+    def clear(self) -> None:
+        super().clear()
+        self._raw_keys.clear()
+
+    def items(self) -> ItemsView[str, Any]:  # type: ignore[override]
+        self._convert_all()
+        return super().items()
+
+    def values(self) -> ValuesView[Any]:  # type: ignore[override]
+        self._convert_all()
+        return super().values()
+
+    def copy(self) -> LazyAdditionalData:
+        """Copies the additional data without converting its raw values
+        Returns:
+            LazyAdditionalData: a shallow copy of the additional data.
+        """
+        copied = LazyAdditionalData(convert=self._convert)
+        dict.update(copied, super().items())
+        copied._raw_keys = set(self._raw_keys)
+        return copied
+
+    def __eq__(self, other: object) -> bool:
+        self._convert_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        self._convert_all()
+        return super().__ne__(other)
+
+    def __or__(self, other: Any) -> Any:
+        self._convert_all()
+        return dict(self).__or__(other)
+
+    def __ror__(self, other: Any) -> Any:
+        self._convert_all()
+        return dict(self).__ror__(other)
+
+    def __ior__(self, other: Any) -> LazyAdditionalData:  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def __repr__(self) -> str:
+        self._convert_all()
+        return f"{type(self).__name__}({super().__repr__()})"
+
+    def __reduce__(self) -> Any:
+        # Pickled with converted values, so that the converter does not have to be picklable
+        return type(self), (dict(self), )
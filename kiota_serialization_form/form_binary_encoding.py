@@ -0,0 +1,16 @@
+"""
+Encodings of the binary values written by write_bytes_value and read by get_bytes_value.
+"""
+from enum import Enum
+
+
+class FormBinaryEncoding(Enum):
+    """How binary values are encoded in form bodies.
+    """
+
+    # Standard base64, escaped like any other value. Parse nodes return the base64 text as bytes
+    # without decoding it, as earlier versions did
+    BASE64 = "base64"
+    # URL safe base64 without padding, which needs no escaping. Values are encoded and decoded in
+    # chunks and parse nodes decode them, also accepting standard or padded base64
+    BASE64URL = "base64url"
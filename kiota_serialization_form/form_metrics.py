@@ -0,0 +1,62 @@
+"""
+Opt-in measurements of form parsing and serialization.
+Factories created with a sink report to it, factories created without one skip every measurement.
+Sinks forward the measurements to a metrics library, e.g. an OpenTelemetry counter or histogram
+or a prometheus_client Counter or Histogram per name, with the attributes as labels.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Dict
+
+# Histograms, durations are in seconds and sizes in bytes
+PARSE_DURATION = "kiota.form.parse.duration"
+PARSE_FIELD_DURATION = "kiota.form.parse.field.duration"
+PARSE_BODY_SIZE = "kiota.form.parse.body.size"
+PARSE_FIELD_COUNT = "kiota.form.parse.body.fields"
+SERIALIZE_DURATION = "kiota.form.serialize.duration"
+SERIALIZE_BODY_SIZE = "kiota.form.serialize.body.size"
+SERIALIZE_FIELD_COUNT = "kiota.form.serialize.body.fields"
+
+# Counters
+UNKNOWN_FIELDS = "kiota.form.parse.unknown_fields"
+ADDITIONAL_DATA_CONVERSIONS = "kiota.form.parse.additional_data.conversions"
+CONVERSION_ERRORS = "kiota.form.parse.conversion_errors"
+DATE_FALLBACKS = "kiota.form.parse.date_fallbacks"
+
+
+class FormMetricsSink(ABC):
+    """Receives the measurements of form parse nodes and serialization writers.
+    Measurements are reported from the thread doing the work, sinks shared by threads must be
+    thread safe.
+
+    Attributes of each measurement:
+        PARSE_DURATION, PARSE_BODY_SIZE, PARSE_FIELD_COUNT, SERIALIZE_DURATION,
+        SERIALIZE_BODY_SIZE, SERIALIZE_FIELD_COUNT and UNKNOWN_FIELDS: "type", the name of the
+        model class.
+        ADDITIONAL_DATA_CONVERSIONS: "type" and "parser", "pendulum" or "uuid" for unknown
+        values that looked like a date or a UUID and were handed to that parser.
+        PARSE_FIELD_DURATION: "type" and "field", the name of the field in the form.
+        CONVERSION_ERRORS: "type", the name of the primitive type a value could not be
+        converted to, the getter returned None (False for bool) instead of raising.
+        DATE_FALLBACKS: "type", the name of the date or time type of a value that was not in
+        a common ISO-8601 shape and was parsed by pendulum.
+    """
+
+    @abstractmethod
+    def add(self, name: str, value: int, attributes: Dict[str, str]) -> None:
+        """Adds to a counter
+        Args:
+            name (str): the name of the counter.
+            value (int): the amount to add.
+            attributes (Dict[str, str]): the attributes of the measurement.
+        """
+
+    @abstractmethod
+    def record(self, name: str, value: float, attributes: Dict[str, str]) -> None:
+        """Records a value of a histogram
+        Args:
+            name (str): the name of the histogram.
+            value (float): the measured value.
+            attributes (Dict[str, str]): the attributes of the measurement.
+        """
@@ -0,0 +1,70 @@
+"""
+Limits bounding the cost of parsing untrusted form bodies.
+Limits are checked while the fields of a body are scanned, a body exceeding one stops being
+scanned at the field that exceeds it.
+"""
+from __future__ import annotations
+
+import sys
+from typing import Optional, Tuple
+
+
+class FormParseLimitError(ValueError):
+    """Raised when a form body exceeds one of the limits of its parse node factory.
+    """
+
+    def __init__(self, limit_name: str, limit: int) -> None:
+        """Creates a new error.
+        Args:
+            limit_name (str): the name of the exceeded limit, e.g. "max_field_count".
+            limit (int): the value of the exceeded limit.
+        """
+        super().__init__(f"Form body exceeds the {limit_name} limit of {limit}")
+        self.limit_name = limit_name
+        self.limit = limit
+
+    def __reduce__(self) -> Tuple[type, Tuple[str, int]]:
+        # Rebuilt from its arguments, the message alone cannot be passed back to __init__
+        return type(self), (self.limit_name, self.limit)
+
+
+class FormParseLimits:
+    """Limits enforced by the parse nodes of a FormParseNodeFactory. Limits that are not set are
+    not enforced. Lengths are measured on the encoded body, in characters for str bodies and in
+    bytes otherwise.
+    """
+
+    __slots__ = ("max_body_size", "max_field_count", "max_key_length", "max_value_length")
+
+    def __init__(
+        self,
+        max_body_size: Optional[int] = None,
+        max_field_count: Optional[int] = None,
+        max_key_length: Optional[int] = None,
+        max_value_length: Optional[int] = None
+    ) -> None:
+        """Creates new limits.
+        Args:
+            max_body_size (Optional[int]): the maximum length of a body.
+            max_field_count (Optional[int]): the maximum number of fields of a body, every value
+            of a repeated key and every field without a separator counts as a field.
+            max_key_length (Optional[int]): the maximum length of a key, or of a field without a
+            separator.
+            max_value_length (Optional[int]): the maximum length of a value.
+        """
+        for limit_name, limit in (
+            ("max_body_size", max_body_size),
+            ("max_field_count", max_field_count),
+            ("max_key_length", max_key_length),
+            ("max_value_length", max_value_length),
+        ):
+            if limit is not None and limit < 0:
+                raise ValueError(f"{limit_name} cannot be negative")
+        self.max_body_size = sys.maxsize if max_body_size is None else max_body_size
+        self.max_field_count = sys.maxsize if max_field_count is None else max_field_count
+        self.max_key_length = sys.maxsize if max_key_length is None else max_key_length
+        self.max_value_length = sys.maxsize if max_value_length is None else max_value_length
+
+
+# Limits of parse nodes created without any
+UNLIMITED = FormParseLimits()
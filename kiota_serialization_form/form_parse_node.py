@@ -1,32 +1,454 @@
 from __future__ import annotations
 
-import warnings
-from collections import defaultdict
+import re
+import string
+import sys
+from array import array
 from datetime import date, datetime, time, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+from functools import lru_cache, partial
+from mmap import mmap
+from time import perf_counter
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar, Union
 from urllib.parse import unquote_plus
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
 import pendulum
 from kiota_abstractions.serialization import Parsable, ParsableFactory, ParseNode
 
+from ._base64url import decode_base64url
+from ._iso8601 import parse_date, parse_datetime, parse_time, parse_timedelta
+from .form_additional_data import LazyAdditionalData
+from .form_binary_encoding import FormBinaryEncoding
+from .form_metrics import (
+    ADDITIONAL_DATA_CONVERSIONS,
+    CONVERSION_ERRORS,
+    DATE_FALLBACKS,
+    PARSE_BODY_SIZE,
+    PARSE_DURATION,
+    PARSE_FIELD_COUNT,
+    PARSE_FIELD_DURATION,
+    UNKNOWN_FIELDS,
+    FormMetricsSink,
+)
+from .form_parse_limits import UNLIMITED, FormParseLimitError, FormParseLimits
+from .form_unknown_fields import UnknownFieldPolicy
+
 T = TypeVar("T", bool, str, int, float, UUID, datetime, timedelta, date, time, bytes)
 
 U = TypeVar("U", bound=Parsable)
 
 K = TypeVar("K", bound=Enum)
 
+RawValue = Union[str, bytes, bytearray, memoryview, mmap]
+
+# A field value as the position of its start and end offsets in the field spans of its node, or
+# the start and end offsets of each of its values when its key repeats
+FieldEntry = Union[int, List[Tuple[int, int]]]
+
+# The conversion errors shared by a node and its child nodes and the field name a node records under
+ErrorTarget = Tuple[Dict[str, ValueError], str]
+
+# Matches a key=value field, or a field without a separator so that it can be skipped
+_FIELD_PATTERN = re.compile(r"([^&=]*)=([^&]*)|[^&]+")
+_BYTES_FIELD_PATTERN = re.compile(rb"([^&=]*)=([^&]*)|[^&]+")
+
+# ASCII characters stripped by int, float and UUID, a superset of string.whitespace
+_ASCII_SPACES = "".join(character for character in map(chr, range(128)) if character.isspace())
+
+# Every ASCII string accepted by pendulum.parse, UUID, int or float is made only of these
+# characters, non-ASCII digits are accepted by all of them
+_DATE_CHARACTERS = " +,-./0123456789:DHMPSTWYZ"
+_UUID_CHARACTERS = string.hexdigits + _ASCII_SPACES + "-{}:_+urnidxX"
+_INT_CHARACTERS = string.digits + _ASCII_SPACES + "+-_"
+_FLOAT_CHARACTERS = _INT_CHARACTERS + ".eEinfatyINFATY"
+_UUID_MIN_LENGTH = 32
+
+_KEY_CACHE_SIZE = 4096
+# Longer keys are decoded without being cached, so that a body cannot pin large keys in memory
+_KEY_CACHE_MAX_LENGTH = 128
+
+# Items a value stripped like str.strip may start or end with: whitespace characters, U+3000 is
+# the last whitespace code point, and in bytes, ASCII whitespace and the bytes of multibyte UTF-8
+# sequences, which may encode whitespace
+_WHITESPACE = frozenset(code for code in range(128) if chr(code).isspace()) | frozenset(
+    range(0x80, 0x100)
+) | frozenset(character for character in map(chr, range(0x3001)) if character.isspace())
+
+_enum_value_indexes: WeakKeyDictionary[Any, Dict[Any, str]] = WeakKeyDictionary()
+
+_cached_str_conversion: Optional[Callable[[str], Any]] = None
+
+
+def _may_be_date(value: str) -> bool:
+    return value == "now" or not value.isascii() or not value.strip(_DATE_CHARACTERS)
+
+
+def _may_be_uuid(value: str) -> bool:
+    return len(value
+               ) >= _UUID_MIN_LENGTH and (not value.isascii() or not value.strip(_UUID_CHARACTERS))
+
+
+def _convert_str(value: str) -> Any:
+    """Converts an additional data string to a date, duration or UUID when it is one.
+    Strings that cannot be one of those are returned before reaching the parsers, which report
+    failures by raising. pendulum raises other errors than ValueError for some malformed values,
+    such as IndexError for "2024/" or OverflowError for durations out of range.
+    """
+    if _may_be_date(value):
+        try:
+            datetime_obj = pendulum.parse(value)
+            if isinstance(datetime_obj, pendulum.Duration):
+                return datetime_obj.as_timedelta()
+            return datetime_obj
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+    if _may_be_uuid(value):
+        try:
+            return UUID(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _convert_additional_str(value: str) -> Any:
+    """Converts an additional data string through the conversion cache when it is enabled"""
+    if _cached_str_conversion is not None and _is_cacheable(value):
+        return _cached_str_conversion(value)
+    return _convert_str(value)
+
+
+def _strip_span(raw_value: RawValue, start: int, end: int) -> Tuple[int, int]:
+    """Narrows the span to its value without the leading and trailing whitespace str.strip
+    removes, bytes are measured on their UTF-8 decoding
+    """
+    value = raw_value[start:end]
+    if isinstance(value, str):
+        stripped_start = start + len(value) - len(value.lstrip())
+        return stripped_start, max(stripped_start, start + len(value.rstrip()))
+    text = str(value, "utf-8", "surrogateescape")
+    leading = text[:len(text) - len(text.lstrip())]
+    trailing = text[len(text.rstrip()):]
+    stripped_start = start + len(leading.encode("utf-8", "surrogateescape"))
+    stripped_end = end - len(trailing.encode("utf-8", "surrogateescape"))
+    return stripped_start, max(stripped_start, stripped_end)
+
+
+def _join_spans(raw_value: RawValue, spans: List[Tuple[int, int]],
+                separator: str) -> Union[str, bytes]:
+    """Joins the values at the given spans of the buffer"""
+    values: List[Any] = [raw_value[start:end] for start, end in spans]
+    if isinstance(raw_value, str):
+        return separator.join(values)
+    return separator.encode("ascii").join(values)
+
+
+def _decode(raw_value: RawValue) -> str:
+    """Url decodes a raw value, decoding bytes as UTF-8 first"""
+    if not isinstance(raw_value, str):
+        raw_value = str(raw_value, "utf-8")
+    return unquote_plus(raw_value)
+
+
+def _decode_uncached_key(raw_key: Union[str, bytes]) -> str:
+    """Decodes a field key, keys are interned so that bodies held in memory share them even
+    after they leave the cache
+    """
+    if not isinstance(raw_key, str):
+        raw_key = str(raw_key, "utf-8")
+    return sys.intern(unquote_plus(raw_key.strip()))
+
+
+_decode_cached_key = lru_cache(maxsize=_KEY_CACHE_SIZE)(_decode_uncached_key)
+
+
+def _decode_key(raw_key: Union[str, bytes]) -> str:
+    """Decodes a field key, keys repeat across bodies of the same model so the results of short
+    keys are cached
+    """
+    if len(raw_key) > _KEY_CACHE_MAX_LENGTH:
+        return _decode_uncached_key(raw_key)
+    return _decode_cached_key(raw_key)
+
+
+def _to_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+def _is_bool(value: str) -> bool:
+    return len(value) in (4, 5) and value.lower() in ("true", "false")
+
+
+# Malformed values are mostly rejected by a character check before the conversion is attempted,
+# the try blocks only catch the values that pass it. Non ASCII digits and spaces are left to the
+# conversion as int and float accept them.
+
+
+def _to_int(value: str) -> Optional[int]:
+    if value.isascii() and value.strip(_INT_CHARACTERS):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
 
-class FormParseNode(ParseNode, Generic[T, U]):
+def _to_float(value: str) -> Optional[float]:
+    if value.isascii() and value.strip(_FLOAT_CHARACTERS):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _to_uuid(value: str) -> Optional[UUID]:
+    if len(value) < _UUID_MIN_LENGTH or (value.isascii() and value.strip(_UUID_CHARACTERS)):
+        return None
+    try:
+        return UUID(value)
+    except ValueError:
+        return None
+
+
+def _to_bytes(value: str) -> bytes:
+    return value.encode("utf-8")
+
+
+def _to_base64url_bytes(value: str) -> Optional[bytes]:
+    # Not stripped, spaces are "+" characters that were url decoded and make the value invalid
+    try:
+        return decode_base64url(value)
+    except ValueError:
+        return None
+
+
+# Converters from a decoded, non null form value to each supported primitive type
+_PRIMITIVE_CONVERTERS: Dict[type, Callable[..., Any]] = {
+    bool: _to_bool,
+    str: str,
+    int: _to_int,
+    float: _to_float,
+    UUID: _to_uuid,
+    datetime: parse_datetime,
+    timedelta: parse_timedelta,
+    date: parse_date,
+    time: parse_time,
+    bytes: _to_bytes,
+}
+
+# Converters of nodes reading binary values as base64url
+_BASE64URL_CONVERTERS: Dict[type, Callable[..., Any]] = {
+    **_PRIMITIVE_CONVERTERS, bytes: _to_base64url_bytes
+}
+
+_DATE_TYPES = frozenset((datetime, timedelta, date, time))
+
+
+def _get_enum_value_index(enum_class: Any) -> Dict[Any, str]:
+    """Gets the member names of an enum class keyed by member value.
+    Indexes are kept while the enum class is alive, they map to names rather than members as a
+    member would keep its class alive.
+    """
+    value_index = _enum_value_indexes.get(enum_class)
+    if value_index is None:
+        value_index = {}
+        for member in enum_class:
+            try:
+                value_index.setdefault(member.value, member.name)
+            except TypeError:
+                # Unhashable values can never equal the string read from the form
+                continue
+        _enum_value_indexes[enum_class] = value_index
+    return value_index
+
+
+def _get_enum_member(enum_class: Any, value_index: Dict[Any, str], value: str) -> Any:
+    """Gets the enum member with the given value, raising if the enum has no such value"""
+    name = value_index.get(value)
+    if name is None:
+        raise Exception(f'Invalid value: {value} for enum {enum_class}.')
+    return enum_class[name]
+
+
+def _measure_field_deserializer(
+    metrics: FormMetricsSink, attributes: Dict[str, str], deserializer: Callable[[ParseNode], None]
+) -> Callable[[ParseNode], None]:
+    """Wraps a field deserializer to report its duration"""
+
+    def measured(node: ParseNode) -> None:
+        started = perf_counter()
+        deserializer(node)
+        metrics.record(PARSE_FIELD_DURATION, perf_counter() - started, attributes)
+
+    return measured
+
+
+def _is_cacheable(value: str) -> bool:
+    """Checks whether the conversion of the value does not depend on the current date"""
+    value = value.lstrip()
+    return value != "now" and not value.startswith("T") and ":" not in value[:3]
+
+
+class FormConversionError(ValueError):
+    """Raised in place of a model parsed in strict mode when values of its fields could not be
+    converted to the types read by its field deserializers.
+    """
+
+    def __init__(self, errors: Dict[str, ValueError]) -> None:
+        """Creates a new error.
+        Args:
+            errors (Dict[str, ValueError]): the conversion error of each field, keyed by name.
+        """
+        super().__init__(f"Invalid values for fields: {', '.join(errors)}")
+        self.errors = errors
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[str, ValueError]]]:
+        # Rebuilt from the errors, the message alone cannot be passed back to __init__
+        return type(self), (self.errors, )
+
+
+class FormParseNode(ParseNode, Generic[T, U]):  # pylint: disable=too-many-instance-attributes
     """Represents a parse node that can be used to parse a form url encoded string."""
 
-    def __init__(self, raw_value: str) -> None:
+    # Parsed bodies are often held in bulk, slots keep the instance dictionary from being created
+    __slots__ = (
+        "_raw_value",
+        "_start",
+        "_end",
+        "_decoded_node",
+        "_decoded_fields",
+        "_field_spans",
+        "_on_before_assign_field_values",
+        "_on_after_assign_field_values",
+        "_metrics",
+        "_conversion_errors",
+        "_value_spans",
+        "_limits",
+        "_projection",
+        "_unknown_fields",
+        "_lazy_additional_data",
+        "_converters",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        raw_value: RawValue,
+        start: int = 0,
+        end: Optional[int] = None,
+        metrics: Optional[FormMetricsSink] = None,
+        *,
+        strict: bool = False,
+        limits: Optional[FormParseLimits] = None,
+        projection: bool = False,
+        unknown_fields: Optional[UnknownFieldPolicy] = None,
+        lazy_additional_data: bool = False,
+        binary_encoding: FormBinaryEncoding = FormBinaryEncoding.BASE64
+    ) -> None:
+        """Creates a parse node over raw_value[start:end]
+        Args:
+            raw_value (RawValue): the form encoded buffer, child nodes share their parent's buffer.
+            start (int): the offset the value of the node starts at.
+            end (Optional[int]): the offset the value of the node ends at, the end of the buffer
+            when omitted.
+            metrics (Optional[FormMetricsSink]): the sink measurements are reported to, shared with
+            the child nodes. Nothing is measured when omitted.
+            strict (bool): whether values that cannot be converted are collected in
+            conversion_errors. Getters return None for them either way.
+            limits (Optional[FormParseLimits]): the limits checked when the fields of the node are
+            scanned, FormParseLimitError is raised by the first getter scanning them when one is
+            exceeded. Nothing is limited when omitted.
+            projection (bool): whether models are only assigned the fields they read, other fields
+            are not kept in their additional data nor decoded.
+            unknown_fields (Optional[UnknownFieldPolicy]): the policy the fields a model does not
+            read are reported to when they are not kept in its additional data. They are dropped
+            when omitted.
+            lazy_additional_data (bool): whether the additional data of models is replaced by a
+            LazyAdditionalData keeping the values of unknown fields as strings until they are read.
+            binary_encoding (FormBinaryEncoding): the encoding of the values read by
+            get_bytes_value, shared with the child nodes.
+        """
         self._raw_value = raw_value
-        self._node = unquote_plus(raw_value)
-        self._fields = self._get_fields(raw_value)
+        self._start = start
+        self._end = len(raw_value) if end is None else end
+        # Decoded value and field table are computed on first use, leaf nodes rarely need both
+        self._decoded_node: Optional[str] = None
+        self._decoded_fields: Optional[Dict[str, FieldEntry]] = None
+        # Start and end offsets of the field values in the buffer, indexed by the field table
+        self._field_spans: Optional[array] = None
         self._on_before_assign_field_values: Optional[Callable[[Parsable], None]] = None
         self._on_after_assign_field_values: Optional[Callable[[Parsable], None]] = None
+        self._metrics = metrics
+        # In strict mode, the errors shared with the child nodes and the field name the errors of
+        # this node are recorded under
+        self._conversion_errors: Optional[ErrorTarget] = ({}, "") if strict else None
+        # The span of each value in the buffer when the node holds the values of a repeated key
+        self._value_spans: Optional[List[Tuple[int, int]]] = None
+        # Child nodes are not limited, a value holds a single field and is bounded by the limits
+        # of its parent
+        self._limits = UNLIMITED if limits is None else limits
+        self._projection = projection
+        self._unknown_fields = unknown_fields
+        self._lazy_additional_data = lazy_additional_data
+        # The converters of the primitive types, which depend on the binary encoding
+        self._converters = (
+            _BASE64URL_CONVERTERS
+            if binary_encoding is FormBinaryEncoding.BASE64URL else _PRIMITIVE_CONVERTERS
+        )
+
+    @property
+    def conversion_errors(self) -> Dict[str, ValueError]:
+        """Gets the values that could not be converted by the getters of this node and its child
+        nodes, keyed by field name. The value of the node itself is keyed by an empty name.
+        Only the first error of a field is kept and errors are only collected in strict mode.
+        Returns:
+            Dict[str, ValueError]: the conversion error of each field.
+        """
+        if self._conversion_errors is None:
+            return {}
+        return self._conversion_errors[0]
+
+    @property
+    def _node(self) -> str:
+        """Gets the url decoded value of the node, decoding it on first access"""
+        if self._decoded_node is None:
+            if self._value_spans is not None:
+                # Scalar getters read the values of a repeated key as comma separated values
+                self._decoded_node = _decode(_join_spans(self._raw_value, self._value_spans, ","))
+                return self._decoded_node
+            raw_value = self._raw_value
+            if self._start or self._end != len(raw_value):
+                raw_value = raw_value[self._start:self._end]
+            self._decoded_node = _decode(raw_value)
+        return self._decoded_node
+
+    def _get_items(self) -> List[str]:
+        """Gets the items read by collection getters, the values of the node, or of each value of
+        a repeated key, split on literal commas. Values are split before they are url decoded, so
+        encoded commas are kept in their item.
+        """
+        raw_value = self._raw_value
+        is_str = isinstance(raw_value, str)
+        raw_items: List[Any] = []
+        for start, end in self._value_spans or ((self._start, self._end), ):
+            value: Any = raw_value[start:end]
+            if isinstance(value, memoryview):
+                value = value.tobytes()
+            raw_items.extend(value.split("," if is_str else b","))
+        # Raw items never contain "&" so they are decoded at once and split on it, unless an item
+        # decoded to one
+        items = _decode(("&" if is_str else b"&").join(raw_items)).split("&")
+        if len(items) == len(raw_items):
+            return items
+        return [_decode(item) for item in raw_items]
+
+    @property
+    def _fields(self) -> Dict[str, FieldEntry]:
+        """Gets the fields of the node keyed by field name, splitting them on first access"""
+        if self._decoded_fields is None:
+            self._decoded_fields = self._get_fields()
+        return self._decoded_fields
 
     def get_str_value(self) -> Optional[str]:
         """Gets the string value from the node
@@ -34,10 +456,7 @@ class FormParseNode(ParseNode, Generic[T, U]):
             str: The string value of the node
         """
         if self._node and self._node != "null":
-            try:
-                return str(self._node)
-            except:
-                return None
+            return str(self._node)
         return None
 
     def get_bool_value(self) -> Optional[bool]:
@@ -45,118 +464,118 @@ class FormParseNode(ParseNode, Generic[T, U]):
         Returns:
             bool: The boolean value of the node
         """
-        if self._node and self._node != "null":
-            return self._node.lower() == "true"
-        return None
+        return self._get_primitive_value(bool)
 
     def get_int_value(self) -> Optional[int]:
         """Gets the integer value of the node
         Returns:
             int: The integer value of the node
         """
-        if self._node and self._node != "null":
-            try:
-                return int(self._node)
-            except:
-                return None
-        return None
+        return self._get_primitive_value(int)
 
     def get_float_value(self) -> Optional[float]:
         """Gets the float value of the node
         Returns:
             float: The integer value of the node
         """
-        if self._node and self._node != "null":
-            try:
-                return float(self._node)
-            except:
-                return None
-        return None
+        return self._get_primitive_value(float)
 
     def get_uuid_value(self) -> Optional[UUID]:
         """Gets the UUID value of the node
         Returns:
             UUID: The GUID value of the node
         """
-        if self._node and self._node != "null":
-            try:
-                return UUID(self._node)
-            except:
-                return None
-        return None
+        return self._get_primitive_value(UUID)
 
     def get_datetime_value(self) -> Optional[datetime]:
         """Gets the datetime value of the node
         Returns:
             datetime: The datetime value of the node
         """
-        if self._node and self._node != "null":
-            try:
-                datetime_obj = pendulum.parse(self._node, exact=True)
-                if isinstance(datetime_obj, pendulum.DateTime):
-                    return datetime_obj
-                return None
-            except:
-                return None
-        return None
+        return self._get_primitive_value(datetime)
 
     def get_timedelta_value(self) -> Optional[timedelta]:
         """Gets the timedelta value of the node
         Returns:
             timedelta: The timedelta value of the node
         """
-        if self._node and self._node != "null":
-            try:
-                datetime_obj = pendulum.parse(self._node, exact=True)
-                if isinstance(datetime_obj, pendulum.Duration):
-                    return datetime_obj.as_timedelta()
-                return None
-            except:
-                return None
-        return None
+        return self._get_primitive_value(timedelta)
 
     def get_date_value(self) -> Optional[date]:
         """Gets the date value of the node
         Returns:
             date: The datevalue of the node in terms on year, month, and day.
         """
-        if self._node and self._node != "null":
-            try:
-                datetime_obj = pendulum.parse(self._node, exact=True)
-                if isinstance(datetime_obj, pendulum.Date):
-                    return datetime_obj
-                return None
-            except:
-                return None
-        return None
+        return self._get_primitive_value(date)
 
     def get_time_value(self) -> Optional[time]:
         """Gets the time value of the node
         Returns:
             time: The time value of the node in terms of hour, minute, and second.
         """
-        if self._node and self._node != "null":
-            try:
-                datetime_obj = pendulum.parse(self._node, exact=True)
-                if isinstance(datetime_obj, pendulum.Time):
-                    return datetime_obj
-                return None
-            except:
-                return None
-        return None
+        return self._get_primitive_value(time)
 
     def get_bytes_value(self) -> Optional[bytes]:
         """Get the bytes value of the node
         Returns:
             bytes: The decoded bytes value
         """
-        if self._node and self._node != "null":
-            try:
-                base64_string = str(self._node)
-                return base64_string.encode("utf-8")
-            except:
-                return None
-        return None
+        # Values are decoded in place unless conversion errors are reported, which show the value
+        if (
+            self._converters is _BASE64URL_CONVERTERS and self._metrics is None
+            and self._conversion_errors is None
+        ):
+            view = self._get_binary_view()
+            if view is not None:
+                try:
+                    return decode_base64url(view, url_encoded=True)
+                except ValueError:
+                    # Values holding escapes, "+" or invalid characters are read url decoded below
+                    pass
+        return self._get_primitive_value(bytes)
+
+    def _get_binary_view(self) -> Optional[memoryview]:
+        """Gets a view of the undecoded value of the node in its buffer when it can be decoded as
+        base64 without being url decoded or stripped first, so large values are not copied whole
+        """
+        raw_value = self._raw_value
+        if isinstance(raw_value, str) or self._value_spans is not None or self._start == self._end:
+            return None
+        view = memoryview(raw_value)[self._start:self._end]
+        if view[0] in _WHITESPACE or view[-1] in _WHITESPACE or view == b"null":
+            return None
+        return view
+
+    def _get_primitive_value(self, primitive_type: type) -> Any:
+        """Converts the value of the node to a primitive type, None when it is empty or null"""
+        node = self._node
+        if not node or node == "null":
+            return None
+        if self._metrics is None and self._conversion_errors is None:
+            return self._converters[primitive_type](node)
+        return self._convert_reported(primitive_type, node)
+
+    def _convert_reported(self, primitive_type: type, value: str) -> Any:
+        """Converts a non null value, reporting values that cannot be converted to the metrics
+        sink and the conversion errors, and dates parsed by pendulum to the metrics sink
+        """
+        metrics = self._metrics
+        attributes = {"type": primitive_type.__name__}
+        converter = self._converters[primitive_type]
+        if primitive_type in _DATE_TYPES and metrics is not None:
+            result = converter(value, lambda _: metrics.add(DATE_FALLBACKS, 1, attributes))
+        else:
+            result = converter(value)
+        if result is None or (primitive_type is bool and not _is_bool(value)):
+            if metrics is not None:
+                metrics.add(CONVERSION_ERRORS, 1, attributes)
+            if self._conversion_errors is not None:
+                errors, field_name = self._conversion_errors
+                errors.setdefault(
+                    field_name,
+                    ValueError(f"Invalid value {value!r} for {primitive_type.__name__}")
+                )
+        return result
 
     def get_child_node(self, field_name: str) -> Optional[ParseNode]:
         """Gets the child node of the node
@@ -164,7 +583,7 @@ class FormParseNode(ParseNode, Generic[T, U]):
             Optional[ParseNode]: The child node of the node
         """
         if field_name in self._fields:
-            return FormParseNode(self._fields[field_name])
+            return self._create_child_node(self._fields[field_name], field_name)
         return None
 
     def get_collection_of_primitive_values(self, primitive_type: type) -> Optional[List[T]]:
@@ -175,15 +594,13 @@ class FormParseNode(ParseNode, Generic[T, U]):
         if not primitive_type:
             raise Exception("Primitive type for deserialization cannot be null")
 
-        primitive_types = {bool, str, int, float, UUID, datetime, timedelta, date, time, bytes}
-        if primitive_type in primitive_types:
-            items = self._node.split(',')
-            result = []
-            for item in items:
-                current_parse_node = self._create_new_node(item)
-                method_name = f"get_{primitive_type.__name__.lower()}_value"  # type: ignore
-                method = getattr(current_parse_node, method_name)
-                result.append(method())
+        converter = self._converters.get(primitive_type)
+        if converter is not None:
+            if self._metrics is not None or self._conversion_errors is not None:
+                converter = partial(self._convert_reported, primitive_type)
+            result: List[Any] = [
+                converter(item) if item and item != "null" else None for item in self._get_items()
+            ]
             return result
         raise Exception(f"Encountered an unknown type during deserialization {primitive_type}")
 
@@ -192,12 +609,18 @@ class FormParseNode(ParseNode, Generic[T, U]):
 
     def get_collection_of_enum_values(self, enum_class: K) -> List[Optional[K]]:
         """Gets the collection of enum values of the node
+        Enum values hold no commas, so items are also split on encoded commas, which separate
+        the values of a list written by write_enum_value.
         Returns:
             List[K]: The collection of enum values
         """
-        values = self._node.split(',')
+        values = [value for item in self._get_items() for value in item.split(",")]
         if values:
-            return list(map(lambda x: self._create_new_node(x).get_enum_value(enum_class), values))
+            value_index = _get_enum_value_index(enum_class)
+            return [
+                _get_enum_member(enum_class, value_index, value) if value else None
+                for value in values
+            ]
         return []
 
     def get_enum_value(self, enum_class: K) -> Any:
@@ -208,18 +631,13 @@ class FormParseNode(ParseNode, Generic[T, U]):
 
         if not self._node:
             return None
-        enum_values = [e.value for e in enum_class]  # type: ignore
-        if self._node in enum_values:
-            return enum_class(self._node)  # type: ignore
+        value_index = _get_enum_value_index(enum_class)
+        if self._node in value_index:
+            return enum_class[value_index[self._node]]  # type: ignore
         values = self._node.split(',')
         if not len(values) > 1:
             raise Exception(f'Invalid value: {self._node} for enum {enum_class}.')
-        result = []
-        for value in values:
-            if value not in enum_values:
-                raise Exception(f'Invalid value: {value} for enum {enum_class}.')
-            result.append(enum_class(value))  # type: ignore
-        return result
+        return [_get_enum_member(enum_class, value_index, value) for value in values]
 
     def get_object_value(self, factory: ParsableFactory[U]) -> U:
         """Gets the model object value of the node
@@ -227,12 +645,18 @@ class FormParseNode(ParseNode, Generic[T, U]):
             Parsable: The model object value of the node
         """
 
+        started = perf_counter() if self._metrics is not None else 0.0
         result = factory.create_from_discriminator_value(self)
         if on_before := self.on_before_assign_field_values:
             on_before(result)
         self._assign_field_values(result)
         if on_after := self.on_after_assign_field_values:
             on_after(result)
+        if self._metrics is not None:
+            attributes = {"type": type(result).__name__}
+            self._metrics.record(PARSE_DURATION, perf_counter() - started, attributes)
+            self._metrics.record(PARSE_BODY_SIZE, self._end - self._start, attributes)
+            self._metrics.record(PARSE_FIELD_COUNT, len(self._fields), attributes)
         return result
 
     @property
@@ -270,33 +694,90 @@ class FormParseNode(ParseNode, Generic[T, U]):
         self._on_after_assign_field_values = value
 
     def _assign_field_values(self, item: U) -> None:
-        """Assigns the field values to the model object"""
-
+        """Assigns the field values to the model object. Unknown fields are kept in the additional
+        data of the model, as raw strings converted on first access in lazy mode, or reported to
+        the unknown field policy without being decoded when the model holds none or the node
+        projects the body onto the fields the model reads.
+        """
+        fields = self._fields
         # if object is null
-        if not self._fields:
+        if not fields:
             return
 
-        item_additional_data = None
-        if not hasattr(item, "additional_data") or item.additional_data is None:
-            item_additional_data = {}
-        else:
-            item_additional_data = item.additional_data
-
+        item_additional_data = None if self._projection else getattr(item, "additional_data", None)
         field_deserializers = item.get_field_deserializers()
-
+        if self._metrics is not None:
+            field_deserializers = self._measure_field_deserializers(
+                item, field_deserializers, item_additional_data is not None
+                and not self._lazy_additional_data
+            )
+        if self._projection:
+            # Only the fields read by the model are looked up, in the order of its deserializers
+            for field_name, field_deserializer in field_deserializers.items():
+                field_value = fields.get(field_name)
+                if field_value is not None:
+                    field_deserializer(self._create_child_node(field_value, field_name))
+        elif item_additional_data is not None and self._lazy_additional_data:
+            raw_values: Dict[str, str] = {}
+            for field_name, field_value in fields.items():
+                if field_name in field_deserializers:
+                    field_deserializer = field_deserializers[field_name]
+                    field_deserializer(self._create_child_node(field_value, field_name))
+                else:
+                    raw_values[field_name] = self._get_raw_field_value(field_value)
+            if raw_values:
+                item.additional_data = LazyAdditionalData(
+                    item_additional_data, raw_values, _convert_additional_str
+                )
+        else:
+            for field_name, field_value in fields.items():
+                if field_name in field_deserializers:
+                    field_deserializer = field_deserializers[field_name]
+                    field_deserializer(self._create_child_node(field_value, field_name))
+                elif item_additional_data is not None:
+                    item_additional_data[field_name] = self.try_get_anything(
+                        self._get_raw_field_value(field_value)
+                    )
+        if item_additional_data is None and self._unknown_fields is not None:
+            unknown_fields = [name for name in fields if name not in field_deserializers]
+            if unknown_fields:
+                self._unknown_fields.report(type(item).__name__, unknown_fields)
+
+    def _measure_field_deserializers(
+        self, item: U, field_deserializers: Dict[str, Callable[[ParseNode], None]],
+        converts_unknown_fields: bool
+    ) -> Dict[str, Callable[[ParseNode], None]]:
+        """Reports the unknown fields of the node, and the conversions of their values when they
+        are converted to additional data, and wraps the deserializers of its known fields to time
+        them
+        """
+        metrics: FormMetricsSink = self._metrics  # type: ignore
+        type_name = type(item).__name__
+        measured_deserializers: Dict[str, Callable[[ParseNode], None]] = {}
+        unknown_fields = 0
         for field_name, field_value in self._fields.items():
             if field_name in field_deserializers:
-                if field_value is None:
-                    continue
-                field_deserializer = field_deserializers[field_name]
-                field_deserializer(FormParseNode(field_value))
-            elif item_additional_data is not None:
-                item_additional_data[field_name] = self.try_get_anything(field_value)
-            else:
-                warnings.warn(
-                    f"Found additional property {field_name} to \
-                    deserialize but the model doesn't support additional data"
+                measured_deserializers[field_name] = _measure_field_deserializer(
+                    metrics, {
+                        "type": type_name,
+                        "field": field_name
+                    }, field_deserializers[field_name]
                 )
+                continue
+            unknown_fields += 1
+            if not converts_unknown_fields:
+                continue
+            raw_field_value = self._get_raw_field_value(field_value)
+            if _may_be_date(raw_field_value):
+                parser = "pendulum"
+            elif _may_be_uuid(raw_field_value):
+                parser = "uuid"
+            else:
+                continue
+            metrics.add(ADDITIONAL_DATA_CONVERSIONS, 1, {"type": type_name, "parser": parser})
+        if unknown_fields:
+            metrics.add(UNKNOWN_FIELDS, unknown_fields, {"type": type_name})
+        return measured_deserializers
 
     def try_get_anything(self, value: Any) -> Any:
         if isinstance(value, (int, float, bool)) or value is None:
@@ -306,43 +787,100 @@ class FormParseNode(ParseNode, Generic[T, U]):
         if isinstance(value, dict):
             return dict(map(lambda x: (x[0], self.try_get_anything(x[1])), value.items()))
         if isinstance(value, str):
-            try:
-                datetime_obj = pendulum.parse(value)
-                if isinstance(datetime_obj, pendulum.Duration):
-                    return datetime_obj.as_timedelta()
-                return datetime_obj
-            except ValueError:
-                pass
-            try:
-                return UUID(value)
-            except ValueError:
-                pass
-            return value
+            return _convert_additional_str(value)
         raise ValueError(f"Unexpected additional value type {type(value)} during deserialization.")
 
-    def _create_new_node(self, node: Any) -> FormParseNode:
-        new_node: FormParseNode = FormParseNode(node)
-        new_node.on_before_assign_field_values = self.on_before_assign_field_values
-        new_node.on_after_assign_field_values = self.on_after_assign_field_values
-        return new_node
-
-    def _get_fields(self, raw_value: str) -> Dict[str, str]:
-        fields = raw_value.split('&')
-        field_values = defaultdict(list)
-        for field in fields:
-            if '=' in field:
-                key, value = field.split('=', 1)
-                key = self._sanitize_key(key)
-                value = value.strip()
-                field_values[key].append(value)
-
-        # Convert lists to comma-separated strings
-        result: Dict[str, str] = {}
-        for key in field_values:
-            result[key] = ','.join(field_values[key])
-        return result
-
-    def _sanitize_key(self, key: str) -> str:
+    @staticmethod
+    def configure_additional_data_cache(maxsize: int) -> None:
+        """Configures the cache of converted additional data values shared by all parse nodes.
+        Payloads often repeat the same unknown field values, caching their conversion avoids
+        parsing them again.
+        Args:
+            maxsize (int): the number of values to keep in the least recently used cache,
+            0 disables caching.
+        """
+        global _cached_str_conversion  # pylint: disable=global-statement
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative")
+        _cached_str_conversion = lru_cache(maxsize=maxsize)(_convert_str) if maxsize else None
+
+    def _get_fields(self) -> Dict[str, FieldEntry]:
+        """Indexes the fields of the node, keys are decoded while values are kept as their span in
+        the buffer and repeated keys keep the span of each of their values. The buffer is scanned
+        in place, bytes are not decoded to a string first and no value is copied out.
+        """
+        if self._value_spans is not None:
+            # The values of a repeated key are scanned as comma separated values
+            self._raw_value = _join_spans(self._raw_value, self._value_spans, ",")
+            self._start, self._end = 0, len(self._raw_value)
+            self._value_spans = None
+        raw_value = self._raw_value
+        limits = self._limits
+        if self._end - self._start > limits.max_body_size:
+            raise FormParseLimitError("max_body_size", limits.max_body_size)
+        # Typed as Any as the str and bytes patterns scan different buffer types
+        pattern: Any = _FIELD_PATTERN if isinstance(raw_value, str) else _BYTES_FIELD_PATTERN
+        # Offsets are packed in an array rather than held as a tuple of ints per field
+        spans = self._field_spans = array("q")
+        fields: Dict[str, FieldEntry] = {}
+        repeated: Dict[str, List[Tuple[int, int]]] = {}
+        for field_count, match in enumerate(pattern.finditer(raw_value, self._start, self._end), 1):
+            span = match.span(2)
+            start, end = span
+            raw_key = match.group(1)
+            # Limits are checked on the encoded field, before its key is decoded
+            if field_count > limits.max_field_count:
+                raise FormParseLimitError("max_field_count", limits.max_field_count)
+            if start < 0:
+                if match.end() - match.start() > limits.max_key_length:
+                    raise FormParseLimitError("max_key_length", limits.max_key_length)
+                continue
+            if len(raw_key) > limits.max_key_length:
+                raise FormParseLimitError("max_key_length", limits.max_key_length)
+            if end - start > limits.max_value_length:
+                raise FormParseLimitError("max_value_length", limits.max_value_length)
+            if start < end and (
+                raw_value[start] in _WHITESPACE or raw_value[end - 1] in _WHITESPACE
+            ):
+                span = start, end = _strip_span(raw_value, start, end)
+            key = self._sanitize_key(raw_key)
+            if key not in fields:
+                fields[key] = len(spans)
+                spans.extend(span)
+            elif key in repeated:
+                repeated[key].append(span)
+            else:
+                first: int = fields[key]  # type: ignore
+                repeated[key] = [(spans[first], spans[first + 1]), span]
+        fields.update(repeated)
+        return fields
+
+    def _get_raw_field_value(self, entry: FieldEntry) -> str:
+        """Gets the undecoded value of a field table entry, values of a repeated key are joined
+        with commas
+        """
+        if isinstance(entry, int):
+            spans: array = self._field_spans  # type: ignore
+            value = self._raw_value[spans[entry]:spans[entry + 1]]
+        else:
+            value = _join_spans(self._raw_value, entry, ",")
+        return value if isinstance(value, str) else str(value, "utf-8")
+
+    def _create_child_node(self, entry: FieldEntry, field_name: str) -> FormParseNode:
+        """Creates the node of a field table entry, sharing the buffer of this node"""
+        node: FormParseNode
+        if isinstance(entry, int):
+            spans: array = self._field_spans  # type: ignore
+            node = FormParseNode(self._raw_value, spans[entry], spans[entry + 1], self._metrics)
+        else:
+            node = FormParseNode(self._raw_value, entry[0][0], entry[-1][1], self._metrics)
+            node._value_spans = entry
+        node._converters = self._converters
+        if self._conversion_errors is not None:
+            node._conversion_errors = (self._conversion_errors[0], field_name)
+        return node
+
+    def _sanitize_key(self, key: Union[str, bytes]) -> str:
         if not key:
-            return key
-        return unquote_plus(key.strip())
+            return ""
+        return _decode_key(key)
@@ -1,12 +1,120 @@
-from kiota_abstractions.serialization import ParseNode, ParseNodeFactory
+from __future__ import annotations
 
-from .form_parse_node import FormParseNode
+import os
+from concurrent.futures import Executor
+from functools import partial
+from itertools import chain
+from mmap import ACCESS_READ, mmap
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+
+from kiota_abstractions.serialization import ParsableFactory, ParseNode, ParseNodeFactory
+
+from ._batching import batches
+from .form_binary_encoding import FormBinaryEncoding
+from .form_metrics import FormMetricsSink
+from .form_parse_limits import FormParseLimits
+from .form_parse_node import FormConversionError, FormParseNode, U
+from .form_unknown_fields import UnknownFieldPolicy
+
+# Creates a parse node with the options of a factory from a buffer and the span of the body in it
+NodeCreator = Callable[..., FormParseNode]
+
+
+def _parse_batch(factory: ParsableFactory, create_node: NodeCreator,
+                 contents: List[bytes]) -> List[Any]:
+    """Parses a batch of bodies, returning the exception raised for a body in its place.
+    Defined at module level so that batches can be sent to process pools.
+    """
+    results: List[Any] = []
+    for content in contents:
+        try:
+            if not content:
+                raise TypeError("Content cannot be null")
+            node = create_node(content)
+            result = node.get_object_value(factory)
+            if node.conversion_errors:
+                raise FormConversionError(node.conversion_errors)
+            results.append(result)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            results.append(error)
+    return results
+
+
+def _map_file(file: Union[str, os.PathLike, int]) -> Optional[mmap]:
+    """Maps a file read only, returning None for an empty file as empty files cannot be mapped.
+    A file descriptor is left open, the mapping holds its own handle to the file.
+    """
+    if isinstance(file, int):
+        if os.fstat(file).st_size == 0:
+            return None
+        return mmap(file, 0, access=ACCESS_READ)
+    with open(file, "rb") as opened_file:
+        if os.fstat(opened_file.fileno()).st_size == 0:
+            return None
+        return mmap(opened_file.fileno(), 0, access=ACCESS_READ)
+
+
+def _iter_lines(content: mmap, create_node: NodeCreator) -> Iterator[FormParseNode]:
+    """Yields a parse node for each non empty line of the content, lines may end with CRLF"""
+    start, size = 0, len(content)
+    while start < size:
+        end = content.find(b"\n", start)
+        if end < 0:
+            end = size
+        body_end = end - 1 if end > start and content[end - 1] == ord("\r") else end
+        if body_end > start:
+            yield create_node(content, start, body_end)
+        start = end + 1
 
 
 class FormParseNodeFactory(ParseNodeFactory):
     """Factory that is used to create FormParseNodes.
     """
 
+    def __init__(
+        self,
+        metrics: Optional[FormMetricsSink] = None,
+        strict: bool = False,
+        limits: Optional[FormParseLimits] = None,
+        projection: bool = False,
+        unknown_fields: Optional[UnknownFieldPolicy] = None,
+        *,
+        lazy_additional_data: bool = False,
+        binary_encoding: FormBinaryEncoding = FormBinaryEncoding.BASE64
+    ) -> None:
+        """Creates a new factory.
+        Args:
+            metrics (Optional[FormMetricsSink]): the sink the parse nodes created by this factory
+            report measurements to. Nothing is measured when omitted.
+            strict (bool): whether the parse nodes created by this factory collect the values
+            that cannot be converted in their conversion_errors.
+            limits (Optional[FormParseLimits]): the limits of the bodies parsed by the parse nodes
+            created by this factory, a FormParseLimitError is raised by the getter scanning a
+            body that exceeds one. Bodies are not limited when omitted.
+            projection (bool): whether models are only assigned the fields they read. Other fields
+            are neither decoded nor kept in the additional data of the models, which suits large
+            bodies of which few fields are read.
+            unknown_fields (Optional[UnknownFieldPolicy]): the policy the fields a model does not
+            read are reported to when they are not kept in its additional data. They are dropped
+            when omitted.
+            lazy_additional_data (bool): whether the additional data of models is a
+            LazyAdditionalData mapping that keeps the values of unknown fields as strings and
+            converts each one when it is first read, instead of converting them all while parsing.
+            binary_encoding (FormBinaryEncoding): the encoding of the binary values read by the
+            parse nodes created by this factory.
+        """
+        # Picklable so that parse_many can send it to process pools
+        self._create_node: NodeCreator = partial(
+            FormParseNode,
+            metrics=metrics,
+            strict=strict,
+            limits=limits,
+            projection=projection,
+            unknown_fields=unknown_fields,
+            lazy_additional_data=lazy_additional_data,
+            binary_encoding=binary_encoding
+        )
+
     def get_valid_content_type(self) -> str:
         """Returns the content type this factory's parse nodes can deserialize
         Returns:
@@ -18,18 +126,92 @@ class FormParseNodeFactory(ParseNodeFactory):
         """Creates a ParseNode from the given binary stream and content type
         Args:
             content_type (str): The content type of the binary stream
-            content (bytes): The array buffer to read from
+            content (bytes): The array buffer to read from, fields are scanned in place and only
+            decoded when read
         Returns:
             ParseNode: A ParseNode that can deserialize the given binary stream
         """
+        self._validate_content_type(content_type)
+
+        if not content:
+            raise TypeError("Content cannot be null")
+
+        return self._create_node(content)
+
+    def get_root_parse_node_from_file(
+        self, content_type: str, file: Union[str, os.PathLike, int]
+    ) -> ParseNode:
+        """Creates a ParseNode over a memory mapped file, for bodies too large to read at once.
+        Pages of the file are loaded by the operating system as they are scanned and only the
+        fields that are read are copied and decoded. The mapping is closed once the returned
+        node and its child nodes are no longer referenced.
+        Args:
+            content_type (str): The content type of the file
+            file (Union[str, os.PathLike, int]): the path or an open file descriptor of the file
+        Returns:
+            ParseNode: A ParseNode that can deserialize the content of the file
+        """
+        self._validate_content_type(content_type)
+        content = _map_file(file)
+        if content is None:
+            raise TypeError("Content cannot be null")
+        return self._create_node(content)
+
+    def iter_root_parse_nodes_from_file(
+        self, content_type: str, file: Union[str, os.PathLike, int]
+    ) -> Iterator[ParseNode]:
+        """Creates a ParseNode for each body of a memory mapped file holding one body per line,
+        such as captured request bodies. Empty lines are skipped.
+        Args:
+            content_type (str): The content type of the bodies
+            file (Union[str, os.PathLike, int]): the path or an open file descriptor of the file
+        Returns:
+            Iterator[ParseNode]: the parse nodes of the bodies in file order, all sharing the
+            mapping of the file.
+        """
+        self._validate_content_type(content_type)
+        content = _map_file(file)
+        if content is None:
+            return iter(())
+        return _iter_lines(content, self._create_node)
+
+    def parse_many(
+        self,
+        content_type: str,
+        contents: Iterable[bytes],
+        factory: ParsableFactory[U],
+        executor: Optional[Executor] = None,
+        batch_size: int = 256
+    ) -> List[Union[U, Exception]]:
+        """Parses many bodies into models of the same type.
+        Enum indexes, date parsing and key decoding caches are shared by the whole batch.
+        Args:
+            content_type (str): The content type of the bodies
+            contents (Iterable[bytes]): The bodies to parse
+            factory (ParsableFactory[U]): The factory creating the models
+            executor (Optional[Executor]): a thread or process pool the batches are spread over,
+            the factory and models must be picklable for process pools. Batches are parsed in
+            the calling thread when omitted. Measurements and unknown fields found in other
+            processes are reported to copies of the metrics sink and unknown field policy.
+            batch_size (int): the number of bodies parsed per batch.
+        Returns:
+            List[Union[U, Exception]]: the models in input order, a body that failed to parse
+            holds the exception raised instead of failing the whole batch. In strict mode a body
+            with values that could not be converted holds a FormConversionError, and a body
+            exceeding the limits of the factory holds a FormParseLimitError.
+        """
+        self._validate_content_type(content_type)
+        if batch_size <= 0:
+            raise ValueError("Batch size must be greater than zero")
+        parse_batch = partial(_parse_batch, factory, self._create_node)
+        content_batches = batches(contents, batch_size)
+        if executor is None:
+            return list(chain.from_iterable(map(parse_batch, content_batches)))
+        return list(chain.from_iterable(executor.map(parse_batch, content_batches)))
+
+    def _validate_content_type(self, content_type: str) -> None:
         if not content_type:
             raise TypeError("Content Type cannot be null")
         valid_content_type = self.get_valid_content_type()
         if valid_content_type.casefold() != content_type.casefold():
             raise TypeError(f"Expected {valid_content_type} as content type")
-
-        if not content:
-            raise TypeError("Content cannot be null")
-
-        content_as_str = content.decode('utf-8')
-        return FormParseNode(content_as_str)
@@ -1,29 +1,147 @@
 from __future__ import annotations
 
 import base64
+import string
 from datetime import date, datetime, time, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, TypeVar
 from urllib.parse import quote_plus
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
 import pendulum
 from kiota_abstractions.serialization import Parsable, SerializationWriter
 
+from ._base64url import append_base64url
+from .form_binary_encoding import FormBinaryEncoding
+from .form_metrics import (
+    SERIALIZE_BODY_SIZE,
+    SERIALIZE_DURATION,
+    SERIALIZE_FIELD_COUNT,
+    FormMetricsSink,
+)
+
 T = TypeVar("T")
 U = TypeVar("U", bound=Parsable)
 
-
-class FormSerializationWriter(SerializationWriter):
-
-    def __init__(self) -> None:
-        self.writer: str = ""
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_KEY_CACHE_SIZE = 4096
+
+# Keys recorded for the shape of a model class at most, bounding shapes recorded from models with
+# many additional data keys
+_SHAPE_MAX_KEYS = 256
+
+# The escapes quote_plus applies to ASCII characters, letting ASCII values be encoded by translate.
+# Indexed by code point, translate looks a tuple up faster than a dict
+_ASCII_ESCAPES = tuple(
+    "+" if character == " " else
+    (character if character in string.ascii_letters + string.digits + "_.-~" else f"%{code:02X}")
+    for code, character in enumerate(map(chr, range(128)))
+)
+
+_PRIMITIVE_WRITER_NAMES: Dict[type, str] = {
+    bool: "write_bool_value",
+    str: "write_str_value",
+    int: "write_int_value",
+    float: "write_float_value",
+    UUID: "write_uuid_value",
+    datetime: "write_datetime_value",
+    timedelta: "write_timedelta_value",
+    date: "write_date_value",
+    time: "write_time_value",
+    bytes: "write_bytes_value",
+}
+
+_primitive_writers: Dict[Tuple[type, type], Optional[Callable[..., None]]] = {}
+
+_key_shapes: WeakKeyDictionary[type, _KeyShape] = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=_KEY_CACHE_SIZE)
+def _encode_key(key: str) -> bytes:
+    """Encodes a field key and its separator, keys are generated property names so results are
+    cached
+    """
+    return f"{quote_plus(key.strip())}=".encode("ascii")
+
+
+def _encode_value(value: str) -> bytes:
+    """Encodes a field value like quote_plus, ASCII values are escaped in a single translate"""
+    value = value.strip()
+    if value.isascii():
+        return value.translate(_ASCII_ESCAPES).encode("ascii")
+    return quote_plus(value).encode("ascii")
+
+
+class _KeyShape:
+    """The keys written by the first serialization of a model class, in order, with their encoded
+    prefixes. Keys are expected in the same order by later serializations, a key written out of
+    order, e.g. after a conditional key was skipped, is looked up by name and keys missing from the
+    shape, such as additional data keys, are encoded as they are written.
+    """
+
+    __slots__ = ("keys", "prefixes", "positions")
+
+    def __init__(self, keys: List[str]) -> None:
+        self.keys = keys
+        # Prefixed with the field separator, which the first field of a body leaves out
+        self.prefixes = [b"&" + _encode_key(key) for key in keys]
+        # The first position of each key
+        self.positions: Dict[str, int] = {}
+        for position, key in enumerate(keys):
+            self.positions.setdefault(key, position)
+
+
+class FormSerializationWriter(SerializationWriter):  # pylint: disable=too-many-instance-attributes
+
+    __slots__ = (
+        "_buffer",
+        "_needs_separator",
+        "depth",
+        "_on_start_object_serialization",
+        "_on_before_object_serialization",
+        "_on_after_object_serialization",
+        "_spare_writer",
+        "_metrics",
+        "_key_shape",
+        "_key_position",
+        "_recorded_keys",
+        "_binary_encoding",
+    )
+
+    def __init__(
+        self,
+        metrics: Optional[FormMetricsSink] = None,
+        binary_encoding: FormBinaryEncoding = FormBinaryEncoding.BASE64
+    ) -> None:
+        """Creates a new writer.
+        Args:
+            metrics (Optional[FormMetricsSink]): the sink measurements are reported to. Nothing is
+            measured when omitted.
+            binary_encoding (FormBinaryEncoding): the encoding of the values written by
+            write_bytes_value.
+        """
+        self._buffer = bytearray()
+        # Whether a field was written before, possibly already handed out by the content iterators
+        self._needs_separator = False
         self.depth = 0
 
         self._on_start_object_serialization: Optional[Callable[[Parsable, SerializationWriter],
                                                                None]] = None
         self._on_before_object_serialization: Optional[Callable[[Parsable], None]] = None
         self._on_after_object_serialization: Optional[Callable[[Parsable], None]] = None
+        # Writer reused for nested values, None while it is in use
+        self._spare_writer: Optional[FormSerializationWriter] = None
+        self._metrics = metrics
+        # The shape of the model being written and the position of its next key, or the keys
+        # written so far while the shape of its class is recorded
+        self._key_shape: Optional[_KeyShape] = None
+        self._key_position = 0
+        self._recorded_keys: Optional[List[str]] = None
+        self._binary_encoding = binary_encoding
 
     def write_str_value(self, key: Optional[str], value: Optional[str]) -> None:
         """Writes the specified string value to the stream with an optional given key.
@@ -32,9 +150,10 @@ class FormSerializationWriter(SerializationWriter):
             value (Optional[str]): The string value to be written.
         """
         if key and value:
-            if len(self.writer) > 0:
-                self.writer += "&"
-            self.writer += f"{quote_plus(key.strip())}={quote_plus(value.strip())}"
+            if self._key_shape is not None:
+                self._write_shaped_field(key, _encode_value(value))
+            else:
+                self._write_field(self._encode_key(key) + _encode_value(value))
 
     def write_bool_value(self, key: Optional[str], value: Optional[bool]) -> None:
         """Writes the specified boolean value to the stream with an optional given key.
@@ -114,11 +233,17 @@ class FormSerializationWriter(SerializationWriter):
     def write_bytes_value(self, key: Optional[str], value: bytes) -> None:
         """Writes the specified byte array as a base64 string to the stream with an optional
         given key.
+        With the BASE64URL encoding, bytearray and memoryview values are written too and the value
+        is encoded in chunks straight into the content, without being escaped.
         Args:
             key (Optional[str]): The key to be used for the written value. May be null.
             value (bytes): The byte array to be written.
         """
-        if key and isinstance(value, bytes):
+        if self._binary_encoding is FormBinaryEncoding.BASE64URL:
+            if key and value and isinstance(value, (bytes, bytearray, memoryview)):
+                self._write_field(self._encode_key(key))
+                append_base64url(self._buffer, value)
+        elif key and isinstance(value, bytes):
             base64_bytes = base64.b64encode(value)
             base64_string = base64_bytes.decode('utf-8')
             self.write_str_value(key, base64_string)
@@ -132,12 +257,11 @@ class FormSerializationWriter(SerializationWriter):
             key (Optional[str]): The key to be used for the written value. May be null.
             values (Optional[List[T]]): The collection of primitive values to be written.
         """
-        primitive_types = [bool, str, int, float, UUID, datetime, timedelta, date, time, Enum]
         if key and values:
             for val in values:
-                if type(val) in primitive_types:
-                    method = getattr(self, f'write_{type(val).__name__.lower()}_value')
-                    method(key, val)
+                writer = self._get_primitive_writer(type(val))
+                if writer is not None:
+                    writer(self, key, val)
 
     def write_collection_of_enum_values(
         self, key: Optional[str], values: Optional[List[Enum]]
@@ -188,24 +312,33 @@ class FormSerializationWriter(SerializationWriter):
             main value when serializing an intersection wrapper.
         """
         if self.depth > 0:
-            raise Exception("Form serialization does not support nested objects.")
+            # A model written by the model being written, serialized on its own and copied
+            temp_writer = self._create_new_writer()
+            temp_writer.write_object_value(key, value, *additional_values_to_merge)
+            self._write_field(b"", temp_writer)
+            self._release_writer(temp_writer)
+            return
         self.depth += 1
-        temp_writer = self._create_new_writer()
+        started = perf_counter() if self._metrics is not None else 0.0
+        # The fields are written straight after the key, so the body is not held twice
+        self._write_field(_encode_key(key) if key is not None else b"=")
+        self._needs_separator = False
+        start = len(self._buffer)
 
         if value is not None:
-            self._serialize_value(temp_writer, value)
+            self._serialize_value(value)
 
         for additional_value in filter(lambda x: x is not None, additional_values_to_merge):
-            self._serialize_value(temp_writer, additional_value)
+            self._serialize_value(additional_value)
             if on_after := self.on_after_object_serialization:
                 on_after(additional_value)
 
         if value and self._on_after_object_serialization:
             self._on_after_object_serialization(value)
 
-        if len(self.writer) > 0:
-            self.writer += "&"
-        self.writer += f"{quote_plus(key.strip()) if key is not None else ''}={temp_writer.writer}"
+        self._needs_separator = True
+        if self._metrics is not None and value is not None:
+            self._report_object(value, self._buffer, start, started)
         self.depth -= 1
 
     def write_null_value(self, key: Optional[str]) -> None:
@@ -221,21 +354,67 @@ class FormSerializationWriter(SerializationWriter):
         Args:
             value (Dict[str, Any]): he additional data to be written.
         """
-        if isinstance(value, dict):
+        if isinstance(value, Mapping):
             for key, val in value.items():
                 if isinstance(val, Parsable):
                     raise Exception("Form serialization does not support nested objects")
                 self.write_any_value(key, val)
 
+    def reset(self) -> None:
+        """Returns the writer to the state it was created in so it can be reused.
+        The written content and the serialization callbacks are discarded, so callbacks set by a
+        previous user are never called for the values written next.
+        """
+        self._clear()
+        self._on_start_object_serialization = None
+        self._on_before_object_serialization = None
+        self._on_after_object_serialization = None
+
     def get_serialized_content(self) -> bytes:
         """Gets the value of the serialized content.
+        Content already handed out by the content iterators is not included.
         Returns:
             bytes: The value of the serialized content.
         """
-        if self.writer:
-            return self.writer.encode('utf-8')
+        if self._buffer:
+            return bytes(self._buffer)
         return b''
 
+    def iter_serialized_content(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yields the content written so far in chunks, removing them from the writer.
+        The iterator ends once that content is drained, it does not wait for later writes. A body
+        can be sent while it is written by draining the writer again after writing more fields.
+        Joined, the chunks are equal to what get_serialized_content would have returned. A model
+        passed to write_object_value is written into the content in one go, so only fields
+        written directly to the writer bound the content held at once.
+        Args:
+            chunk_size (int): the maximum size of a chunk in bytes.
+        Returns:
+            Iterator[bytes]: the chunks of serialized content.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be greater than zero")
+        return self._drain_buffer(chunk_size)
+
+    @property
+    def writer(self) -> str:
+        """Gets the content written so far as a string.
+        The underlying buffer holds encoded bytes; this view decodes them on access and is kept
+        for compatibility with callers that read or assign the writer directly.
+        Returns:
+            str: the content written so far.
+        """
+        return self._buffer.decode('utf-8')
+
+    @writer.setter
+    def writer(self, value: str) -> None:
+        """Replaces the content written so far.
+        Args:
+            value (str): the content to replace the buffer with.
+        """
+        self._buffer = bytearray(value.encode('utf-8')) if value else bytearray()
+        self._needs_separator = bool(value)
+
     @property
     def on_before_object_serialization(self) -> Optional[Callable[[Parsable], None]]:
         """Gets the callback called before the object gets serialized.
@@ -304,10 +483,9 @@ class FormSerializationWriter(SerializationWriter):
             if hasattr(value, '__dict__'):
                 temp_writer = self._create_new_writer()
                 for k, v in value.__dict__.items():
-                    temp_writer.write_str_value(key, value.__dict__)
-                if len(self.writer) > 0:
-                    self.writer += "&"
-                self.writer += f"{quote_plus(key.strip())}={temp_writer.writer}"
+                    temp_writer.write_any_value(k, v)
+                self._write_field(_encode_key(key), temp_writer)
+                self._release_writer(temp_writer)
 
     def write_any_value(self, key: Optional[str], value: Any) -> Any:
         """Writes the specified value to the stream with an optional given key.
@@ -315,12 +493,11 @@ class FormSerializationWriter(SerializationWriter):
             key (Optional[str]): The key to be used for the written value. May be null.
             value Any): The value to be written.
         """
-        primitive_types = [bool, str, int, float, UUID, datetime, timedelta, date, time, Enum]
         if key and value:
             value_type = type(value)
-            if value_type in primitive_types:
-                method = getattr(self, f'write_{value_type.__name__.lower()}_value')
-                method(key, value)
+            writer = self._get_primitive_writer(value_type)
+            if writer is not None:
+                writer(self, key, value)
             elif isinstance(value, list):
                 if all(isinstance(x, Enum) for x in value):
                     self.write_collection_of_enum_values(key, value)
@@ -336,17 +513,138 @@ class FormSerializationWriter(SerializationWriter):
                         with key {key}"
                 )
 
-    def _serialize_value(self, temp_writer: FormSerializationWriter, value: U):
+    def _write_field(
+        self, fragment: bytes, nested_writer: Optional[FormSerializationWriter] = None
+    ) -> None:
+        """Appends an encoded field to the buffer, separating it from any previous field.
+        Args:
+            fragment (bytes): the already url encoded field, or its key prefix when a nested
+            writer follows.
+            nested_writer (Optional[FormSerializationWriter]): a writer whose buffer is
+            appended verbatim after the fragment.
+        """
+        if self._needs_separator:
+            self._buffer += b"&"
+        self._buffer += fragment
+        if nested_writer is not None:
+            self._buffer += nested_writer._buffer
+        self._needs_separator = True
+
+    def _encode_key(self, key: str) -> bytes:
+        """Encodes a field key and its separator, recording the key when the shape of the model
+        being written is recorded
+        """
+        if self._recorded_keys is not None and len(self._recorded_keys) < _SHAPE_MAX_KEYS:
+            self._recorded_keys.append(key)
+        return _encode_key(key)
+
+    def _write_shaped_field(self, key: str, encoded_value: bytes) -> None:
+        """Appends a field of the model being written, taking the encoded separator and key from
+        the shape of the model when the key is part of it
+        """
+        shape: _KeyShape = self._key_shape  # type: ignore
+        position = self._key_position
+        if position >= len(shape.keys) or shape.keys[position] != key:
+            found_position = shape.positions.get(key)
+            if found_position is None:
+                self._write_field(_encode_key(key) + encoded_value)
+                return
+            position = found_position
+        self._key_position = position + 1
+        buffer = self._buffer
+        if self._needs_separator:
+            buffer += shape.prefixes[position]
+        else:
+            buffer += shape.prefixes[position][1:]
+        buffer += encoded_value
+        self._needs_separator = True
+
+    def _get_primitive_writer(self, value_type: type) -> Optional[Callable[..., None]]:
+        """Gets the write method for values of the given type.
+        Subclasses of the supported types, such as pendulum types, resolve through their MRO and
+        enum members always resolve to the enum writer. Results are cached per writer class.
+        Args:
+            value_type (type): the type of the value to write.
+        Returns:
+            Optional[Callable[..., None]]: the unbound write method, None if the type is not a
+            primitive type.
+        """
+        cache_key = (type(self), value_type)
+        if cache_key in _primitive_writers:
+            return _primitive_writers[cache_key]
+        method_name = None
+        if issubclass(value_type, Enum):
+            method_name = "write_enum_value"
+        else:
+            for base_type in value_type.__mro__:
+                method_name = _PRIMITIVE_WRITER_NAMES.get(base_type)
+                if method_name:
+                    break
+        writer = getattr(type(self), method_name) if method_name else None
+        _primitive_writers[cache_key] = writer
+        return writer
+
+    def _clear(self) -> None:
+        """Discards the written content so the writer can serialize another value"""
+        self._buffer.clear()
+        self._needs_separator = False
+        self.depth = 0
+        self._key_shape = None
+        self._recorded_keys = None
+
+    def _drain_buffer(self, chunk_size: int) -> Iterator[bytes]:
+        while self._buffer:
+            chunk = bytes(self._buffer[:chunk_size])
+            del self._buffer[:chunk_size]
+            yield chunk
+
+    def _serialize_value(self, value: U):
         if on_before := self.on_before_object_serialization:
             on_before(value)
         if on_start := self.on_start_object_serialization:
             on_start(value, self)
 
-        value.serialize(temp_writer)
-
-    def _create_new_writer(self) -> SerializationWriter:
-        writer = FormSerializationWriter()
+        value_type = type(value)
+        shape = _key_shapes.get(value_type)
+        if shape is None:
+            self._recorded_keys = []
+            value.serialize(self)
+            _key_shapes[value_type] = _KeyShape(self._recorded_keys)
+            self._recorded_keys = None
+        else:
+            self._key_shape, self._key_position = shape, 0
+            value.serialize(self)
+            self._key_shape = None
+
+    def _create_new_writer(self) -> FormSerializationWriter:
+        writer = self._spare_writer
+        if writer is None:
+            writer = FormSerializationWriter(self._metrics, self._binary_encoding)
+        else:
+            # Taken out so that a callback writing to this writer gets a writer of its own
+            self._spare_writer = None
         writer.on_before_object_serialization = self.on_before_object_serialization
         writer.on_after_object_serialization = self.on_after_object_serialization
         writer.on_start_object_serialization = self.on_start_object_serialization
         return writer
+
+    def _report_object(
+        self, value: Parsable, buffer: bytearray, start: int, started: float
+    ) -> None:
+        """Reports the duration, size and number of fields of a model serialized in the buffer
+        from the given start
+        """
+        metrics: FormMetricsSink = self._metrics  # type: ignore
+        attributes = {"type": type(value).__name__}
+        size = len(buffer) - start
+        metrics.record(SERIALIZE_DURATION, perf_counter() - started, attributes)
+        metrics.record(SERIALIZE_BODY_SIZE, size, attributes)
+        metrics.record(
+            SERIALIZE_FIELD_COUNT,
+            buffer.count(b"&", start) + 1 if size else 0, attributes
+        )
+
+    def _release_writer(self, writer: FormSerializationWriter) -> None:
+        """Keeps a writer created by _create_new_writer for the next nested value"""
+        writer.reset()
+        self._spare_writer = writer
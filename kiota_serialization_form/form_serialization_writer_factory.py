@@ -1,12 +1,62 @@
-from kiota_abstractions.serialization import SerializationWriter, SerializationWriterFactory
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+from itertools import chain
+from typing import Deque, Iterable, Iterator, List, Optional
 
+from kiota_abstractions.serialization import (
+    Parsable,
+    SerializationWriter,
+    SerializationWriterFactory,
+)
+
+from ._batching import batches
+from .form_binary_encoding import FormBinaryEncoding
+from .form_metrics import FormMetricsSink
 from .form_serialization_writer import FormSerializationWriter
 
 
+def _serialize_batch(
+    metrics: Optional[FormMetricsSink], binary_encoding: FormBinaryEncoding, values: List[Parsable]
+) -> List[bytes]:
+    """Serializes a batch of models with a single writer.
+    Defined at module level so that batches can be sent to process pools.
+    """
+    writer = FormSerializationWriter(metrics, binary_encoding)
+    contents = []
+    for value in values:
+        writer.write_object_value(None, value)
+        contents.append(writer.get_serialized_content())
+        writer.reset()
+    return contents
+
+
 class FormSerializationWriterFactory(SerializationWriterFactory):
     """A factory that creates FormSerializationWriter instances.
     """
 
+    def __init__(
+        self,
+        pool_size: int = 0,
+        metrics: Optional[FormMetricsSink] = None,
+        binary_encoding: FormBinaryEncoding = FormBinaryEncoding.BASE64
+    ) -> None:
+        """Creates a new factory.
+        Args:
+            pool_size (int): the maximum number of released writers kept for reuse by
+            get_serialization_writer. Writers are not pooled when zero.
+            metrics (Optional[FormMetricsSink]): the sink the writers created by this factory
+            report measurements to. Nothing is measured when omitted.
+            binary_encoding (FormBinaryEncoding): the encoding of the binary values written by
+            the writers created by this factory.
+        """
+        if pool_size < 0:
+            raise ValueError("Pool size cannot be negative")
+        self._metrics = metrics
+        self._binary_encoding = binary_encoding
+        self._pool: Optional[Deque[FormSerializationWriter]
+                             ] = (deque(maxlen=pool_size) if pool_size else None)
+
     def get_valid_content_type(self) -> str:
         """Gets the content type this factory creates serialization writers for.
         Returns:
@@ -21,10 +71,63 @@ class FormSerializationWriterFactory(SerializationWriterFactory):
         Returns:
             SerializationWriter: A new SerializationWriter instance for the given content type.
         """
+        self._validate_content_type(content_type)
+        if self._pool:
+            try:
+                return self._pool.pop()
+            except IndexError:
+                pass
+        return FormSerializationWriter(self._metrics, self._binary_encoding)
+
+    def release_serialization_writer(self, writer: SerializationWriter) -> None:
+        """Returns a writer created by this factory to the pool once its content has been read.
+        The writer is reset, discarding its content and callbacks, and must not be used by the
+        caller afterwards. The pool keeps the most recently released writers when it is full.
+        Writers whose metrics sink or binary encoding differ from the ones of this factory, such
+        as writers of another factory, are not pooled.
+        Args:
+            writer (SerializationWriter): the writer to release.
+        """
+        if (
+            self._pool is not None and isinstance(writer, FormSerializationWriter)
+            and writer._metrics is self._metrics
+            and writer._binary_encoding is self._binary_encoding
+        ):
+            writer.reset()
+            self._pool.append(writer)
+
+    def serialize_many(
+        self,
+        content_type: str,
+        values: Iterable[Parsable],
+        executor: Optional[Executor] = None,
+        batch_size: int = 256
+    ) -> Iterator[bytes]:
+        """Serializes many models, yielding their serialized content in input order.
+        Each model is written the same way as a request body, with write_object_value and no key.
+        Args:
+            content_type (str): the content type to serialize the models to.
+            values (Iterable[Parsable]): the models to serialize.
+            executor (Optional[Executor]): a thread or process pool the batches are spread over,
+            models must be picklable for process pools. Batches are serialized in the calling
+            thread when omitted. Measurements made in other processes are reported to a copy of
+            the metrics sink.
+            batch_size (int): the number of models serialized per batch.
+        Returns:
+            Iterator[bytes]: the serialized content of each model.
+        """
+        self._validate_content_type(content_type)
+        if batch_size <= 0:
+            raise ValueError("Batch size must be greater than zero")
+        serialize_batch = partial(_serialize_batch, self._metrics, self._binary_encoding)
+        value_batches = batches(values, batch_size)
+        if executor is None:
+            return chain.from_iterable(map(serialize_batch, value_batches))
+        return chain.from_iterable(executor.map(serialize_batch, value_batches))
+
+    def _validate_content_type(self, content_type: str) -> None:
         if not content_type:
             raise TypeError("Content Type cannot be null")
         valid_content_type = self.get_valid_content_type()
         if valid_content_type.casefold() != content_type.casefold():
             raise TypeError(f"Expected {valid_content_type} as content type")
-
-        return FormSerializationWriter()
@@ -0,0 +1,66 @@
+"""
+Policies for the fields of a form body that the parsed model does not read.
+A policy receives the unknown fields of a body when they are not kept in the additional data of
+the model, either because the model holds none or because the parse node factory projects bodies
+onto the fields the model reads. Unknown fields are dropped without being decoded when no policy
+is set.
+"""
+from __future__ import annotations
+
+import warnings
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import List, Set, Tuple
+
+
+class UnknownFieldPolicy(ABC):
+    """Receives the unknown fields of each parsed body. Policies are called from the thread doing
+    the parsing, policies shared by threads must be thread safe.
+    """
+
+    @abstractmethod
+    def report(self, model_type: str, field_names: List[str]) -> None:
+        """Reports the unknown fields of a body, only called for bodies that have some
+        Args:
+            model_type (str): the name of the class of the parsed model.
+            field_names (List[str]): the decoded names of the unknown fields.
+        """
+
+
+class CountUnknownFields(UnknownFieldPolicy):
+    """Counts the unknown fields of the parsed bodies per model type and field name.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Counter[Tuple[str, str]] = Counter()
+
+    def report(self, model_type: str, field_names: List[str]) -> None:
+        """Adds the unknown fields of a body to the counts
+        Args:
+            model_type (str): the name of the class of the parsed model.
+            field_names (List[str]): the decoded names of the unknown fields.
+        """
+        self.counts.update((model_type, field_name) for field_name in field_names)
+
+
+class WarnOnceUnknownFields(UnknownFieldPolicy):
+    """Issues a warning the first time a field name is found in a body of a model type.
+    """
+
+    def __init__(self) -> None:
+        self._warned: Set[Tuple[str, str]] = set()
+
+    def report(self, model_type: str, field_names: List[str]) -> None:
+        """Warns about the unknown fields of a body that were not warned about before
+        Args:
+            model_type (str): the name of the class of the parsed model.
+            field_names (List[str]): the decoded names of the unknown fields.
+        """
+        for field_name in field_names:
+            if (model_type, field_name) not in self._warned:
+                self._warned.add((model_type, field_name))
+                warnings.warn(
+                    f"Found additional property {field_name} to deserialize but the model "
+                    f"{model_type} doesn't read it",
+                    stacklevel=2
+                )
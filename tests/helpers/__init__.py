@@ -1,2 +1,3 @@
+from .recording_metrics_sink import RecordingMetricsSink
 from .test_entity import TestEntity
-from .test_enum import TestEnum
\ No newline at end of file
+from .test_enum import TestEnum
@@ -0,0 +1,29 @@
+from typing import Dict, List, Tuple
+
+from kiota_serialization_form.form_metrics import FormMetricsSink
+
+
+class RecordingMetricsSink(FormMetricsSink):
+    """Keeps every measurement reported to it"""
+
+    def __init__(self) -> None:
+        self.counters: List[Tuple[str, int, Dict[str, str]]] = []
+        self.histograms: List[Tuple[str, float, Dict[str, str]]] = []
+
+    def add(self, name: str, value: int, attributes: Dict[str, str]) -> None:
+        self.counters.append((name, value, attributes))
+
+    def record(self, name: str, value: float, attributes: Dict[str, str]) -> None:
+        self.histograms.append((name, value, attributes))
+
+    def count(self, name: str, **attributes: str) -> int:
+        return sum(
+            value for counter, value, counter_attributes in self.counters
+            if counter == name and attributes.items() <= counter_attributes.items()
+        )
+
+    def values(self, name: str, **attributes: str) -> List[float]:
+        return [
+            value for histogram, value, histogram_attributes in self.histograms
+            if histogram == name and attributes.items() <= histogram_attributes.items()
+        ]
@@ -0,0 +1,47 @@
+import base64
+import os
+
+import pytest
+
+from kiota_serialization_form._base64url import append_base64url, decode_base64url
+
+SIZES = [0, 1, 2, 3, 4, 5, 64, 3 * 16 * 1024 - 1, 3 * 16 * 1024 + 1, 200_000]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_append_base64url_matches_unpadded_urlsafe_b64encode(size):
+    value = os.urandom(size)
+    buffer = bytearray(b"key=")
+    append_base64url(buffer, value)
+    assert bytes(buffer) == b"key=" + base64.urlsafe_b64encode(value).rstrip(b"=")
+
+
+def test_append_base64url_encodes_memoryviews():
+    value = os.urandom(1_000)
+    buffer = bytearray()
+    append_base64url(buffer, memoryview(value)[10:100])
+    assert bytes(buffer) == base64.urlsafe_b64encode(value[10:100]).rstrip(b"=")
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_decode_base64url_reverses_the_encodings(size):
+    value = os.urandom(size)
+    encoded = base64.urlsafe_b64encode(value)
+    assert decode_base64url(memoryview(encoded.rstrip(b"="))) == value
+    assert decode_base64url(encoded.decode("ascii")) == value
+    assert decode_base64url(base64.b64encode(value)) == value
+
+
+@pytest.mark.parametrize(
+    "value", ["SGVsbG8gd29ybGQ%3D", "SGVs bG8", "SGVsbG8=d29ybGQ", "SGVsb", "é"]
+)
+def test_decode_base64url_rejects_invalid_values(value):
+    with pytest.raises(ValueError):
+        decode_base64url(value)
+
+
+def test_decode_base64url_rejects_plus_in_url_encoded_values():
+    assert decode_base64url(b"++//") == b"\xfb\xef\xff"
+    assert decode_base64url(b"--//", url_encoded=True) == b"\xfb\xef\xff"
+    with pytest.raises(ValueError):
+        decode_base64url(b"++//", url_encoded=True)
@@ -0,0 +1,95 @@
+import copy
+import json
+import pickle
+from datetime import date
+
+from kiota_serialization_form.form_additional_data import LazyAdditionalData
+
+
+class _RecordingConverter:
+
+    def __init__(self):
+        self.converted = []
+
+    def __call__(self, value):
+        self.converted.append(value)
+        return value.upper()
+
+
+def test_raw_values_are_converted_once_on_first_access():
+    convert = _RecordingConverter()
+    data = LazyAdditionalData({"kept": 1}, {"a": "x", "b": "y"}, convert)
+    assert "a" in data
+    assert list(data) == ["kept", "a", "b"]
+    assert len(data) == 3
+    assert convert.converted == []
+    assert data["a"] == "X"
+    assert data["a"] == "X"
+    assert data.get("b") == "Y"
+    assert data.get("missing") is None
+    assert convert.converted == ["x", "y"]
+
+
+def test_set_and_deleted_values_are_not_converted():
+    convert = _RecordingConverter()
+    data = LazyAdditionalData(raw_values={"a": "x", "b": "y"}, convert=convert)
+    data["a"] = "set"
+    del data["b"]
+    assert data == {"a": "set"}
+    assert convert.converted == []
+
+
+def test_lazy_additional_data_compares_like_a_dict():
+    data = LazyAdditionalData({"kept": date(2017, 9, 4)}, {"a": "x"}, str.upper)
+    assert data == {"kept": date(2017, 9, 4), "a": "X"}
+    assert {"kept": date(2017, 9, 4), "a": "X"} == data
+    assert dict(data.items()) == {"kept": date(2017, 9, 4), "a": "X"}
+    assert repr(data) == "LazyAdditionalData({'kept': datetime.date(2017, 9, 4), 'a': 'X'})"
+
+
+def test_copies_keep_raw_values_unconverted():
+    convert = _RecordingConverter()
+    data = LazyAdditionalData(raw_values={"a": "x"}, convert=convert)
+    copied = data.copy()
+    assert copied["a"] == "X"
+    assert convert.converted == ["x"]
+    assert data["a"] == "X"
+    assert convert.converted == ["x", "x"]
+
+
+def test_lazy_additional_data_pickles_converted_values():
+    data = LazyAdditionalData(raw_values={"a": "x"}, convert=lambda value: value.upper())
+    for restored in (pickle.loads(pickle.dumps(data)), copy.deepcopy(data)):
+        assert isinstance(restored, LazyAdditionalData)
+        assert restored == {"a": "X"}
+
+
+def test_lazy_additional_data_is_a_dict_converting_values_read_in_bulk():
+    data = LazyAdditionalData({"kept": 1}, {"a": "x", "b": "y"}, str.upper)
+    assert isinstance(data, dict)
+    assert json.dumps(data) == '{"kept": 1, "a": "X", "b": "Y"}'
+    assert dict(data) == {"kept": 1, "a": "X", "b": "Y"}
+    assert {**data} == {"kept": 1, "a": "X", "b": "Y"}
+    assert list(data.values()) == [1, "X", "Y"]
+
+
+def test_lazy_additional_data_converts_popped_values():
+    convert = _RecordingConverter()
+    data = LazyAdditionalData(raw_values={"a": "x", "b": "y", "c": "z"}, convert=convert)
+    assert data.pop("a") == "X"
+    assert data.pop("missing", None) is None
+    assert data.popitem() == ("c", "Z")
+    assert data.setdefault("b") == "Y"
+    assert convert.converted == ["x", "z", "y"]
+    assert data == {"b": "Y"}
+
+
+def test_updated_values_are_not_converted():
+    convert = _RecordingConverter()
+    data = LazyAdditionalData(raw_values={"a": "x", "b": "y"}, convert=convert)
+    data.update({"a": "set"}, c="new")
+    assert convert.converted == []
+    assert data == {"a": "set", "b": "Y", "c": "new"}
+    assert convert.converted == ["y"]
+    data.clear()
+    assert data == {}
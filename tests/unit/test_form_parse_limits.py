@@ -0,0 +1,137 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from kiota_serialization_form.form_parse_limits import FormParseLimitError, FormParseLimits
+from kiota_serialization_form.form_parse_node import FormParseNode
+from kiota_serialization_form.form_parse_node_factory import FormParseNodeFactory
+
+from ..helpers import TestEntity
+
+FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+# Adversarial bodies are large enough to take seconds to parse without limits
+ADVERSARIAL_SIZE = 8_000_000
+
+
+def parse_limited(body, limits, monkeypatch=None):
+    """Parses a body exceeding the limits, returning the error and the number of keys decoded
+    before scanning stopped
+    """
+    decoded_keys = []
+    if monkeypatch is not None:
+        sanitize_key = FormParseNode._sanitize_key
+        monkeypatch.setattr(
+            FormParseNode, "_sanitize_key",
+            lambda node, key: decoded_keys.append(key) or sanitize_key(node, key)
+        )
+    node = FormParseNode(body, limits=limits)
+    with pytest.raises(FormParseLimitError) as error_info:
+        node.get_object_value(TestEntity)
+    assert node._decoded_fields is None
+    return error_info.value, len(decoded_keys)
+
+
+def test_negative_limits_are_rejected():
+    with pytest.raises(ValueError) as error_info:
+        FormParseLimits(max_field_count=-1)
+    assert str(error_info.value) == "max_field_count cannot be negative"
+
+
+@pytest.mark.parametrize(
+    "limits, limit_name", [
+        (FormParseLimits(max_body_size=20), "max_body_size"),
+        (FormParseLimits(max_field_count=2), "max_field_count"),
+        (FormParseLimits(max_key_length=8), "max_key_length"),
+        (FormParseLimits(max_value_length=6), "max_value_length"),
+    ]
+)
+def test_limits_are_enforced(limits, limit_name):
+    error, _ = parse_limited(b"id=1&officeLocation=Nairobi&age=42", limits)
+    assert error.limit_name == limit_name
+    assert str(error) == f"Form body exceeds the {limit_name} limit of {error.limit}"
+
+
+def test_fields_without_separator_are_limited_as_keys():
+    error, _ = parse_limited(b"a=1&flag" + b"x" * 100, FormParseLimits(max_key_length=10))
+    assert error.limit_name == "max_key_length"
+
+
+def test_bodies_within_limits_are_parsed():
+    limits = FormParseLimits(
+        max_body_size=64, max_field_count=2, max_key_length=14, max_value_length=7
+    )
+    node = FormParseNode(b"id=&officeLocation=Nairobi", limits=limits)
+    assert node.get_object_value(TestEntity).office_location == "Nairobi"
+
+
+def test_factory_nodes_are_limited():
+    factory = FormParseNodeFactory(limits=FormParseLimits(max_field_count=1))
+    root = factory.get_root_parse_node(FORM_CONTENT_TYPE, b"id=1&officeLocation=Nairobi")
+    with pytest.raises(FormParseLimitError):
+        root.get_object_value(TestEntity)
+
+
+def test_parse_many_returns_limit_errors_in_place():
+    factory = FormParseNodeFactory(limits=FormParseLimits(max_value_length=4))
+    results = factory.parse_many(
+        FORM_CONTENT_TYPE, [b"officeLocation=Nairobi", b"officeLocation=Rome"], TestEntity
+    )
+    assert isinstance(results[0], FormParseLimitError)
+    assert results[1].office_location == "Rome"
+
+
+def test_limit_errors_pickle_with_their_limit():
+    error = pickle.loads(pickle.dumps(FormParseLimitError("max_field_count", 3)))
+    assert (error.limit_name, error.limit) == ("max_field_count", 3)
+    assert str(error) == "Form body exceeds the max_field_count limit of 3"
+
+
+def test_parse_many_returns_limit_errors_in_place_on_a_process_pool():
+    factory = FormParseNodeFactory(limits=FormParseLimits(max_value_length=4))
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        results = factory.parse_many(
+            FORM_CONTENT_TYPE, [b"officeLocation=Nairobi", b"officeLocation=Rome"],
+            TestEntity,
+            executor=executor
+        )
+    assert isinstance(results[0], FormParseLimitError)
+    assert results[0].limit_name == "max_value_length"
+    assert results[1].office_location == "Rome"
+
+
+def test_many_fields_stop_at_the_field_limit(monkeypatch):
+    body = b"a=1&" * (ADVERSARIAL_SIZE // 4)
+    error, decoded_keys = parse_limited(body, FormParseLimits(max_field_count=1000), monkeypatch)
+    assert error.limit_name == "max_field_count"
+    assert decoded_keys == 1000
+
+
+def test_many_repeated_values_stop_at_the_field_limit(monkeypatch):
+    body = b"tag=" + b"&tag=".join([b"x"] * (ADVERSARIAL_SIZE // 6))
+    error, decoded_keys = parse_limited(body, FormParseLimits(max_field_count=1000), monkeypatch)
+    assert error.limit_name == "max_field_count"
+    assert decoded_keys == 1000
+
+
+def test_separators_only_stop_at_the_body_size_limit(monkeypatch):
+    body = b"&" * ADVERSARIAL_SIZE
+    error, decoded_keys = parse_limited(
+        body, FormParseLimits(max_body_size=1_000_000), monkeypatch
+    )
+    assert error.limit_name == "max_body_size"
+    assert decoded_keys == 0
+
+
+def test_huge_key_stops_before_it_is_decoded(monkeypatch):
+    body = b"%41" * (ADVERSARIAL_SIZE // 3) + b"=1"
+    error, decoded_keys = parse_limited(body, FormParseLimits(max_key_length=1024), monkeypatch)
+    assert error.limit_name == "max_key_length"
+    assert decoded_keys == 0
+
+
+def test_huge_value_stops_before_the_next_field(monkeypatch):
+    body = b"a=" + b"x" * ADVERSARIAL_SIZE + b"&b=1"
+    error, decoded_keys = parse_limited(body, FormParseLimits(max_value_length=1024), monkeypatch)
+    assert error.limit_name == "max_value_length"
+    assert decoded_keys == 0
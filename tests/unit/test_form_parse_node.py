@@ -1,11 +1,27 @@
 import base64
-from datetime import date, datetime, time, timedelta
+import gc
+import json
+import weakref
+from datetime import date, datetime, time, timedelta, timezone
+from enum import Enum
 from uuid import UUID
 
+import pendulum
 import pytest
 
-from kiota_serialization_form.form_parse_node import FormParseNode
-from ..helpers import TestEntity, TestEnum
+from kiota_serialization_form import form_metrics
+from kiota_serialization_form.form_additional_data import LazyAdditionalData
+from kiota_serialization_form.form_binary_encoding import FormBinaryEncoding
+from kiota_serialization_form.form_parse_node import (
+    FormParseNode,
+    _decode_cached_key,
+    _to_float,
+    _to_int,
+    _to_uuid,
+)
+from kiota_serialization_form.form_serialization_writer import FormSerializationWriter
+from kiota_serialization_form.form_unknown_fields import CountUnknownFields
+from ..helpers import RecordingMetricsSink, TestEntity, TestEnum
 
 TEST_USER_FORM: str = (
     "displayName=Megan+Bowen&"
@@ -179,4 +195,440 @@ def test_get_object_value():
 def returns_default_if_child_node_does_not_exist():
     parse_node = FormParseNode(TEST_USER_FORM)
     result = parse_node.get_child_node("nonExistent")
-    assert result == None
\ No newline at end of file
+    assert result == None
+
+def test_leaf_node_defers_field_splitting():
+    parse_node = FormParseNode("1454")
+    assert parse_node.get_int_value() == 1454
+    assert parse_node._decoded_fields is None
+
+
+def test_root_node_defers_decoding():
+    parse_node = FormParseNode(TEST_USER_FORM)
+    assert parse_node.get_child_node("jobTitle").get_str_value() == "Auditor"
+    assert parse_node._decoded_node is None
+
+
+def test_child_nodes_reference_the_parent_buffer():
+    body = b"displayName=Megan+Bowen&jobTitle=%20Auditor+&numbers=one&numbers=%20two"
+    parse_node = FormParseNode(body)
+    child_node = parse_node.get_child_node("displayName")
+    assert child_node._raw_value is body
+    assert child_node.get_str_value() == "Megan Bowen"
+    assert parse_node.get_child_node("jobTitle").get_str_value() == " Auditor "
+    assert parse_node.get_child_node("numbers").get_str_value() == "one, two"
+
+
+@pytest.mark.parametrize("body", [" a = 1 & b =\t2\n", b" a = 1 & b =\t2\n"])
+def test_child_node_values_are_stripped(body):
+    parse_node = FormParseNode(body)
+    assert parse_node.get_child_node("a").get_int_value() == 1
+    assert parse_node.get_child_node("b").get_int_value() == 2
+
+
+@pytest.mark.parametrize("encode", [lambda body: body, lambda body: body.encode("utf-8")])
+def test_bytes_and_str_values_are_stripped_alike(encode):
+    parse_node = FormParseNode(encode("a=1\x1c&\u00a0b\u00a0=\u00a0x\u3000&c=caf\u00e9\u00a0"))
+    assert parse_node.get_child_node("a").get_str_value() == "1"
+    assert parse_node.get_child_node("b").get_str_value() == "x"
+    assert parse_node.get_child_node("c").get_str_value() == "caf\u00e9"
+
+
+def test_node_fields_stay_within_its_span():
+    body = b"a=1&b=2&c=3"
+    parse_node = FormParseNode(body, 2, 7)
+    assert parse_node.get_str_value() == "1&b=2"
+    assert list(parse_node._fields) == ["b"]
+    assert parse_node.get_child_node("b").get_int_value() == 2
+    assert parse_node.get_child_node("c") is None
+
+
+@pytest.mark.parametrize("body", ["tag=a%2Cb&tag=c&tag=null", b"tag=a%2Cb&tag=c&tag=null"])
+def test_collections_read_each_value_of_a_repeated_key(body):
+    parse_node = FormParseNode(body)
+    assert parse_node._fields["tag"] == [(4, 9), (14, 15), (20, 24)]
+    child_node = parse_node.get_child_node("tag")
+    assert child_node.get_collection_of_primitive_values(str) == ["a,b", "c", None]
+    assert child_node.get_str_value() == "a,b,c,null"
+
+
+@pytest.mark.parametrize("encode", [lambda body: body, lambda body: body.encode("ascii")])
+def test_collections_split_literal_commas_of_single_and_repeated_keys(encode):
+    parse_node = FormParseNode(encode("ids=1,2&ids=3&one=4,5&tag=a%2Cb&e=one,two&e=eight"))
+    assert parse_node.get_child_node("ids").get_collection_of_primitive_values(int) == [1, 2, 3]
+    assert parse_node.get_child_node("one").get_collection_of_primitive_values(int) == [4, 5]
+    assert parse_node.get_child_node("tag").get_collection_of_primitive_values(str) == ["a,b"]
+    assert parse_node.get_child_node("e").get_collection_of_enum_values(TestEnum) == [
+        TestEnum.One, TestEnum.Two, TestEnum.Eight
+    ]
+
+
+def test_collections_of_a_repeated_key_keep_encoded_ampersands():
+    parse_node = FormParseNode(b"tag=a%26b&tag=c+d&other=1")
+    child_node = parse_node.get_child_node("tag")
+    assert child_node.get_collection_of_primitive_values(str) == ["a&b", "c d"]
+
+
+def test_enum_collections_read_values_written_by_the_writer():
+    writer = FormSerializationWriter()
+    writer.write_enum_value("numbers", [TestEnum.Four, TestEnum.Eight])
+    writer.write_str_value("numbers", "one")
+    parse_node = FormParseNode(writer.get_serialized_content())
+    assert parse_node.get_child_node("numbers").get_collection_of_enum_values(TestEnum) == [
+        TestEnum.Four, TestEnum.Eight, TestEnum.One
+    ]
+
+
+def test_enum_collections_read_each_value_of_a_repeated_key():
+    parse_node = FormParseNode(memoryview(b"numbers=one&numbers=two"))
+    child_node = parse_node.get_child_node("numbers")
+    assert child_node.get_collection_of_enum_values(TestEnum) == [TestEnum.One, TestEnum.Two]
+    assert child_node.get_enum_value(TestEnum) == [TestEnum.One, TestEnum.Two]
+
+
+def test_field_keys_are_shared_across_bodies():
+    first_body = FormParseNode(b"office%20Location=Seattle")
+    first_keys = list(first_body._fields)
+    _decode_cached_key.cache_clear()
+    second_body = FormParseNode("office+Location=Redmond")
+    assert list(second_body._fields)[0] is first_keys[0]
+
+
+def test_long_field_keys_are_not_cached():
+    _decode_cached_key.cache_clear()
+    long_key = b"k" * 2_000_000
+    node = FormParseNode(long_key + b"=1&short=2")
+    assert list(node._fields) == [long_key.decode(), "short"]
+    assert _decode_cached_key.cache_info().currsize == 1
+
+
+def test_try_get_anything_classifies_strings():
+    parse_node = FormParseNode("")
+    assert parse_node.try_get_anything("Auditor") == "Auditor"
+    assert parse_node.try_get_anything("path/to/file") == "path/to/file"
+    assert parse_node.try_get_anything("2017-09-04") == datetime(2017, 9, 4, tzinfo=timezone.utc)
+    assert parse_node.try_get_anything("PT1H") == timedelta(hours=1)
+    assert parse_node.try_get_anything("PT30S") == timedelta(seconds=30)
+    assert parse_node.try_get_anything("PT1M30S") == timedelta(minutes=1, seconds=30)
+    assert parse_node.try_get_anything("P1DT2H3M4S") == timedelta(
+        days=1, hours=2, minutes=3, seconds=4
+    )
+    assert parse_node.try_get_anything("P1W") == timedelta(weeks=1)
+    assert parse_node.try_get_anything(
+        "\uff18f841f30-e6e3-439a-a812-ebd369559c36"
+    ) == UUID("8f841f30-e6e3-439a-a812-ebd369559c36")
+    assert parse_node.try_get_anything(
+        "48d31887-5fad-4d73-a9f5-3c356e68a038"
+    ) == UUID("48d31887-5fad-4d73-a9f5-3c356e68a038")
+
+
+@pytest.mark.parametrize("value", ["2024/", "1/", "/1", "T/", "12:00/", "P9999999999D"])
+def test_try_get_anything_keeps_strings_pendulum_fails_on(value):
+    assert FormParseNode("").try_get_anything(value) == value
+    result = FormParseNode(f"jobTitle={value}".encode()).get_object_value(TestEntity)
+    assert result.additional_data["jobTitle"] == value
+
+
+def _parse_with_fallbacks(value):
+    """Converts like try_get_anything did before strings were classified"""
+    try:
+        result = pendulum.parse(value)
+        return result.as_timedelta() if isinstance(result, pendulum.Duration) else result
+    except Exception:
+        pass
+    try:
+        return UUID(value)
+    except ValueError:
+        return value
+
+
+@pytest.mark.parametrize(
+    "value", [
+        "PT30S", "PT1M30S", "P1DT2H3M4S", "P1Y2M3DT4H5M6S", "P1W", "PT0.5S", "2017-W01-1",
+        "2017-001", "20170904T101112", "2017-09-04 10:11:12+02:00", "10:11:12.5", "S", "PTS",
+        "8f841f30e6e3439aa812ebd369559c36", "\uff18f841f30-e6e3-439a-a812-ebd369559c36",
+        "urn:uuid:8f841f30-e6e3-439a-a812-ebd369559c36", "Seattle", "1,5", "\u0662\u0660\u0661\u0667"
+    ]
+)
+def test_try_get_anything_matches_parsing_with_fallbacks(value):
+    assert FormParseNode("").try_get_anything(value) == _parse_with_fallbacks(value)
+
+
+def test_try_get_anything_with_cache():
+    FormParseNode.configure_additional_data_cache(16)
+    try:
+        parse_node = FormParseNode("")
+        first = parse_node.try_get_anything("2017-09-04")
+        assert parse_node.try_get_anything("2017-09-04") is first
+        assert parse_node.try_get_anything("Auditor") == "Auditor"
+    finally:
+        FormParseNode.configure_additional_data_cache(0)
+
+
+def test_configure_additional_data_cache_negative_size():
+    with pytest.raises(ValueError):
+        FormParseNode.configure_additional_data_cache(-1)
+
+
+def test_get_enum_value_multiple():
+    parse_node = FormParseNode("one%2Ceight")
+    result = parse_node.get_enum_value(TestEnum)
+    assert result == [TestEnum.One, TestEnum.Eight]
+
+
+def test_enum_value_index_does_not_keep_enum_class_alive():
+    DynamicEnum = Enum("DynamicEnum", {"Read": "read", "Write": "write"})
+    parse_node = FormParseNode("read,write")
+    assert parse_node.get_collection_of_enum_values(DynamicEnum) == [
+        DynamicEnum.Read, DynamicEnum.Write
+    ]
+    enum_class_ref = weakref.ref(DynamicEnum)
+    del DynamicEnum
+    gc.collect()
+    assert enum_class_ref() is None
+
+
+@pytest.mark.parametrize(
+    "primitive_type, getter, items", [
+        (int, "get_int_value", ["1", "x", "null", ""]),
+        (float, "get_float_value", ["1.5", "x", "2"]),
+        (bool, "get_bool_value", ["true", "False", "null"]),
+        (str, "get_str_value", ["a b", "null", ""]),
+        (UUID, "get_uuid_value", ["8f841f30-e6e3-439a-a812-ebd369559c36", "x"]),
+        (date, "get_date_value", ["2017-09-04", "x"]),
+        (time, "get_time_value", ["08:00:00", "x"]),
+        (datetime, "get_datetime_value", ["2017-07-29T03:07:25Z", "x"]),
+        (timedelta, "get_timedelta_value", ["PT1H", "x"]),
+    ]
+)
+def test_get_collection_of_primitive_values_matches_getters(primitive_type, getter, items):
+    parse_node = FormParseNode(",".join(items))
+    expected = [getattr(FormParseNode(item), getter)() for item in items]
+    assert parse_node.get_collection_of_primitive_values(primitive_type) == expected
+
+
+def test_metrics_count_conversion_errors():
+    sink = RecordingMetricsSink()
+    assert FormParseNode(b"abc", metrics=sink).get_int_value() is None
+    assert FormParseNode(b"not-a-uuid", metrics=sink).get_uuid_value() is None
+    assert FormParseNode(b"", metrics=sink).get_int_value() is None
+    assert sink.count(form_metrics.CONVERSION_ERRORS, type="int") == 1
+    assert sink.count(form_metrics.CONVERSION_ERRORS, type="UUID") == 1
+
+
+def test_metrics_count_date_fallbacks():
+    sink = RecordingMetricsSink()
+    assert FormParseNode(b"2017-09-04", metrics=sink).get_date_value() == date(2017, 9, 4)
+    assert sink.count(form_metrics.DATE_FALLBACKS) == 0
+    assert FormParseNode(b"20170904", metrics=sink).get_date_value() == date(2017, 9, 4)
+    assert sink.count(form_metrics.DATE_FALLBACKS, type="date") == 1
+
+
+def test_metrics_count_additional_data_conversions():
+    sink = RecordingMetricsSink()
+    node = FormParseNode(
+        b"officeLocation=a&jobTitle=Auditor&since=2017-09-04&"
+        b"tenant=8f841f30-e6e3-439a-a812-ebd369559c36",
+        metrics=sink
+    )
+    result = node.get_object_value(TestEntity)
+    assert result.additional_data["jobTitle"] == "Auditor"
+    assert sink.count(form_metrics.UNKNOWN_FIELDS, type="TestEntity") == 3
+    assert sink.count(form_metrics.ADDITIONAL_DATA_CONVERSIONS, parser="pendulum") == 1
+    assert sink.count(form_metrics.ADDITIONAL_DATA_CONVERSIONS, parser="uuid") == 1
+
+
+def _convert_or_none(converter, value):
+    try:
+        return converter(value)
+    except ValueError:
+        return None
+
+
+@pytest.mark.parametrize(
+    "value", [
+        "42", " -17 ", "+3", "1_000", "1__0", "_1", "3.25", ".5", "5.", "1e5", "1E-3", "1_0.5",
+        "inf", "-Infinity", "nan", "abc", "12a", "n/a", "--1", "1-", "\x1c7\x1f", "\u0663",
+        "\u00b2", "\u00a012", "8f841f30-e6e3-439a-a812-ebd369559c36",
+        "{8F841F30E6E3439AA812EBD369559C36}", "urn:uuid:8f841f30-e6e3-439a-a812-ebd369559c36",
+        "8f841f30-e6e3-439a-a812-ebd369559c3g", "0x8f841f30e6e3439aa812ebd369559c3",
+        "\x1c8f841f30e6e3439aa812ebd369559c3"
+    ]
+)
+def test_prechecks_return_the_same_results_as_the_conversions(value):
+    assert _to_int(value) == _convert_or_none(int, value)
+    float_value = _convert_or_none(float, value)
+    if float_value != float_value:
+        assert _to_float(value) != _to_float(value)
+    else:
+        assert _to_float(value) == float_value
+    assert _to_uuid(value) == _convert_or_none(UUID, value)
+
+
+def test_strict_mode_collects_conversion_errors_per_field():
+    node = FormParseNode(
+        b"id=not-a-uuid&birthDay=yesterday&officeLocation=Nairobi&deviceNames=a", strict=True
+    )
+    result = node.get_object_value(TestEntity)
+    assert result.id is None
+    assert result.birthday is None
+    assert result.office_location == "Nairobi"
+    assert list(node.conversion_errors) == ["id", "birthDay"]
+    assert str(node.conversion_errors["id"]) == "Invalid value 'not-a-uuid' for UUID"
+
+
+def test_strict_mode_collects_errors_of_child_nodes_and_collections():
+    node = FormParseNode(b"age=ten&flags=true,maybe&ok=1", strict=True)
+    assert node.get_child_node("age").get_int_value() is None
+    assert node.get_child_node("flags").get_collection_of_primitive_values(bool) == [True, False]
+    assert node.get_child_node("ok").get_int_value() == 1
+    assert list(node.conversion_errors) == ["age", "flags"]
+
+
+def test_strict_mode_keys_the_value_of_the_node_by_an_empty_name():
+    node = FormParseNode("1.5.2", strict=True)
+    assert node.get_float_value() is None
+    assert list(node.conversion_errors) == [""]
+
+
+def test_conversion_errors_are_not_collected_by_default():
+    node = FormParseNode(b"age=ten")
+    assert node.get_child_node("age").get_int_value() is None
+    assert node.conversion_errors == {}
+
+
+class _EntityWithoutAdditionalData(TestEntity):
+
+    @staticmethod
+    def create_from_discriminator_value(parse_node=None):
+        return _EntityWithoutAdditionalData(additional_data=None)
+
+
+def test_projection_skips_fields_the_model_does_not_read():
+    policy = CountUnknownFields()
+    node = FormParseNode(
+        b"officeLocation=Nairobi&jobTitle=%FF%FE&id=8f841f30-e6e3-439a-a812-ebd369559c36&mail=a",
+        projection=True,
+        unknown_fields=policy
+    )
+    result = node.get_object_value(TestEntity)
+    assert result.office_location == "Nairobi"
+    assert result.id == UUID("8f841f30-e6e3-439a-a812-ebd369559c36")
+    assert result.additional_data == {}
+    assert policy.counts == {("TestEntity", "jobTitle"): 1, ("TestEntity", "mail"): 1}
+
+
+def test_unknown_fields_of_models_without_additional_data_are_reported():
+    policy = CountUnknownFields()
+    node = FormParseNode(b"officeLocation=Nairobi&jobTitle=Auditor", unknown_fields=policy)
+    result = node.get_object_value(_EntityWithoutAdditionalData)
+    assert result.office_location == "Nairobi"
+    assert result.additional_data is None
+    assert policy.counts == {("_EntityWithoutAdditionalData", "jobTitle"): 1}
+
+
+def test_unknown_fields_kept_in_additional_data_are_not_reported():
+    policy = CountUnknownFields()
+    node = FormParseNode(b"officeLocation=Nairobi&jobTitle=Auditor", unknown_fields=policy)
+    assert node.get_object_value(TestEntity).additional_data == {"jobTitle": "Auditor"}
+    assert not policy.counts
+
+
+def test_metrics_do_not_count_conversions_of_projected_fields():
+    sink = RecordingMetricsSink()
+    node = FormParseNode(
+        b"officeLocation=a&since=2017-09-04&tenant=8f841f30-e6e3-439a-a812-ebd369559c36",
+        metrics=sink,
+        projection=True
+    )
+    assert node.get_object_value(TestEntity).office_location == "a"
+    assert sink.count(form_metrics.UNKNOWN_FIELDS, type="TestEntity") == 2
+    assert sink.count(form_metrics.ADDITIONAL_DATA_CONVERSIONS) == 0
+
+
+def test_lazy_additional_data_converts_unknown_fields_on_access(monkeypatch):
+    converted = []
+    monkeypatch.setattr(
+        "kiota_serialization_form.form_parse_node._convert_str",
+        lambda value: converted.append(value) or value
+    )
+    node = FormParseNode(TEST_USER_FORM, lazy_additional_data=True)
+    result = node.get_object_value(TestEntity)
+    assert isinstance(result.additional_data, LazyAdditionalData)
+    assert result.id == UUID("48d31887-5fad-4d73-a9f5-3c356e68a038")
+    assert "jobTitle" in result.additional_data
+    assert converted == []
+    assert result.additional_data["jobTitle"] == "Auditor"
+    assert converted == ["Auditor"]
+
+
+def test_lazy_additional_data_matches_eager_conversion():
+    eager = FormParseNode(TEST_USER_FORM).get_object_value(TestEntity)
+    lazy = FormParseNode(TEST_USER_FORM, lazy_additional_data=True).get_object_value(TestEntity)
+    assert lazy.additional_data == eager.additional_data
+    assert list(lazy.additional_data) == list(eager.additional_data)
+    assert json.dumps(lazy.additional_data, default=str) == json.dumps(
+        eager.additional_data, default=str
+    )
+
+
+def test_lazy_additional_data_is_not_set_without_unknown_fields():
+    result = FormParseNode(b"officeLocation=a", lazy_additional_data=True).get_object_value(
+        TestEntity
+    )
+    assert result.additional_data == {}
+    assert type(result.additional_data) is dict
+
+
+@pytest.mark.parametrize(
+    "raw_value", [b"SGVsbG8gd29ybGQ", "SGVsbG8gd29ybGQ", b"SGVsbG8gd29ybGQ=", b"SGVsbG8gd29ybGQ%3D"]
+)
+def test_base64url_nodes_decode_bytes_values(raw_value):
+    node = FormParseNode(raw_value, binary_encoding=FormBinaryEncoding.BASE64URL)
+    assert node.get_bytes_value() == b"Hello world"
+
+
+def test_base64url_child_nodes_decode_bytes_values():
+    node = FormParseNode(
+        b"file=-__-&empty=&none=null&files=-__-&files=SGk",
+        binary_encoding=FormBinaryEncoding.BASE64URL
+    )
+    assert node.get_child_node("file").get_bytes_value() == b"\xfb\xff\xfe"
+    assert node.get_child_node("empty").get_bytes_value() is None
+    assert node.get_child_node("none").get_bytes_value() is None
+    assert node.get_child_node("files").get_collection_of_primitive_values(bytes) == [
+        b"\xfb\xff\xfe", b"Hi"
+    ]
+
+
+def test_base64url_nodes_report_invalid_bytes_values():
+    node = FormParseNode(
+        b"file=not+base64&ok=SGk", strict=True, binary_encoding=FormBinaryEncoding.BASE64URL
+    )
+    assert node.get_child_node("file").get_bytes_value() is None
+    assert node.get_child_node("ok").get_bytes_value() == b"Hi"
+    assert list(node.conversion_errors) == ["file"]
+
+
+@pytest.mark.parametrize(
+    "body, expected", [
+        ("f=++++//8=", None),
+        ("f=%2B%2B%2B%2B//8=", b"\xfb\xef\xbe\xff\xff"),
+        ("f=-__-", b"\xfb\xff\xfe"),
+        ("f=+SGk", None),
+    ]
+)
+def test_base64url_values_decode_alike_on_every_path(body, expected):
+    results = []
+    for raw_value in (body, body.encode("ascii"), memoryview(body.encode("ascii"))):
+        for options in ({}, {"strict": True}, {"metrics": RecordingMetricsSink()}):
+            node = FormParseNode(raw_value, binary_encoding=FormBinaryEncoding.BASE64URL, **options)
+            results.append(node.get_child_node("f").get_bytes_value())
+            if "strict" in options:
+                assert list(node.conversion_errors) == ([] if expected else ["f"])
+    assert results == [expected] * 9
+
+
+def test_base64_nodes_return_the_undecoded_bytes_value():
+    node = FormParseNode(b"SGk", binary_encoding=FormBinaryEncoding.BASE64)
+    assert node.get_bytes_value() == b"SGk"
@@ -1,7 +1,14 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import pytest
 
-from kiota_serialization_form.form_parse_node import FormParseNode
+from kiota_serialization_form import form_metrics
+from kiota_serialization_form.form_binary_encoding import FormBinaryEncoding
+from kiota_serialization_form.form_parse_node import FormConversionError, FormParseNode
 from kiota_serialization_form.form_parse_node_factory import FormParseNodeFactory
+from kiota_serialization_form.form_unknown_fields import CountUnknownFields
+
+from ..helpers import RecordingMetricsSink, TestEntity, TestEnum
 
 
 FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
@@ -45,4 +52,187 @@ def test_get_root_parse_node_empty_form():
 def test_get_valid_content_type():
     factory = FormParseNodeFactory()
     content_type = factory.get_valid_content_type()
-    assert content_type == FORM_CONTENT_TYPE
\ No newline at end of file
+    assert content_type == FORM_CONTENT_TYPE
+
+def test_get_root_parse_node_reads_bytes_in_place():
+    factory = FormParseNodeFactory()
+    content = "name=Tesla&city=New+York&caf%C3%A9=cr%C3%A8me&café=brûlée".encode('utf-8')
+    root = factory.get_root_parse_node(FORM_CONTENT_TYPE, content)
+    assert root.get_child_node("city").get_str_value() == "New York"
+    assert root.get_child_node("café").get_collection_of_primitive_values(str) == [
+        "crème", "brûlée"
+    ]
+
+
+def test_get_root_parse_node_from_memoryview(sample_form_string):
+    factory = FormParseNodeFactory()
+    content = memoryview(sample_form_string.encode('utf-8'))
+    root = factory.get_root_parse_node(FORM_CONTENT_TYPE, content)
+    assert root.get_child_node("age").get_int_value() == 2
+    assert root.get_child_node("city").get_str_value() == "New York"
+
+
+def test_get_object_value_from_bytes():
+    factory = FormParseNodeFactory()
+    content = b"officeLocation=Seattle&jobTitle=Auditor&otherPhones=1&otherPhones=2"
+    root = factory.get_root_parse_node(FORM_CONTENT_TYPE, content)
+    result = root.get_object_value(TestEntity)
+    assert result.office_location == "Seattle"
+    assert result.additional_data == {"jobTitle": "Auditor", "otherPhones": "1,2"}
+
+
+def test_get_root_parse_node_from_file(tmp_path):
+    path = tmp_path / "body.form"
+    path.write_bytes(b"officeLocation=Seattle&deviceNames=d1&deviceNames=d2&jobTitle=Auditor\n")
+    factory = FormParseNodeFactory()
+    root = factory.get_root_parse_node_from_file(FORM_CONTENT_TYPE, str(path))
+    result = root.get_object_value(TestEntity)
+    assert result.office_location == "Seattle"
+    assert result.device_names == ["d1", "d2"]
+    assert result.additional_data == {"jobTitle": "Auditor"}
+
+
+def test_get_root_parse_node_from_file_descriptor(tmp_path):
+    path = tmp_path / "body.form"
+    path.write_bytes(b"name=Tesla&city=New+York")
+    factory = FormParseNodeFactory()
+    with open(path, "rb") as file:
+        root = factory.get_root_parse_node_from_file(FORM_CONTENT_TYPE, file.fileno())
+        assert root.get_child_node("city").get_str_value() == "New York"
+
+
+def test_get_root_parse_node_from_empty_file(tmp_path):
+    path = tmp_path / "body.form"
+    path.write_bytes(b"")
+    with pytest.raises(TypeError):
+        FormParseNodeFactory().get_root_parse_node_from_file(FORM_CONTENT_TYPE, path)
+
+
+def test_iter_root_parse_nodes_from_file(tmp_path):
+    path = tmp_path / "bodies.form"
+    path.write_bytes(b"officeLocation=Seattle\r\n\nofficeLocation=Redmond&numbers=one\nnumbers=two")
+    factory = FormParseNodeFactory()
+    results = [
+        root.get_object_value(TestEntity)
+        for root in factory.iter_root_parse_nodes_from_file(FORM_CONTENT_TYPE, path)
+    ]
+    assert [result.office_location for result in results] == ["Seattle", "Redmond", None]
+    assert [result.numbers for result in results] == [None, TestEnum.One, TestEnum.Two]
+
+
+def test_iter_root_parse_nodes_from_empty_file(tmp_path):
+    path = tmp_path / "bodies.form"
+    path.write_bytes(b"")
+    factory = FormParseNodeFactory()
+    assert list(factory.iter_root_parse_nodes_from_file(FORM_CONTENT_TYPE, path)) == []
+
+
+def test_parse_many():
+    factory = FormParseNodeFactory()
+    contents = [
+        b"officeLocation=Seattle&deviceNames=d1&deviceNames=d2",
+        b"",
+        b"officeLocation=Redmond&numbers=one",
+        b"numbers=thirty+two",
+    ]
+    results = factory.parse_many(FORM_CONTENT_TYPE, contents, TestEntity, batch_size=3)
+    assert len(results) == 4
+    assert results[0].office_location == "Seattle"
+    assert results[0].device_names == ["d1", "d2"]
+    assert isinstance(results[1], TypeError)
+    assert results[2].office_location == "Redmond"
+    assert results[2].numbers == TestEnum.One
+    assert "Invalid value: thirty two" in str(results[3])
+
+
+def test_parse_many_with_executor():
+    factory = FormParseNodeFactory()
+    contents = [f"officeLocation=Office+{i}".encode('utf-8') for i in range(10)]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = factory.parse_many(
+            FORM_CONTENT_TYPE, contents, TestEntity, executor=executor, batch_size=3
+        )
+    assert [result.office_location for result in results] == [f"Office {i}" for i in range(10)]
+
+
+def test_parse_many_unsupported_content_type():
+    with pytest.raises(TypeError):
+        FormParseNodeFactory().parse_many('application/xml', [b"a=b"], TestEntity)
+
+
+def test_root_parse_node_reports_to_metrics_sink():
+    sink = RecordingMetricsSink()
+    factory = FormParseNodeFactory(metrics=sink)
+    content = b"id=8f841f30-e6e3-439a-a812-ebd369559c36&officeLocation=Nairobi&extra=1"
+    root = factory.get_root_parse_node(FORM_CONTENT_TYPE, content)
+    root.get_object_value(TestEntity)
+    assert sink.values(form_metrics.PARSE_BODY_SIZE, type="TestEntity") == [len(content)]
+    assert sink.values(form_metrics.PARSE_FIELD_COUNT, type="TestEntity") == [3]
+    assert len(sink.values(form_metrics.PARSE_DURATION, type="TestEntity")) == 1
+    assert len(sink.values(form_metrics.PARSE_FIELD_DURATION, field="id")) == 1
+    assert len(sink.values(form_metrics.PARSE_FIELD_DURATION, field="officeLocation")) == 1
+    assert sink.count(form_metrics.UNKNOWN_FIELDS, type="TestEntity") == 1
+
+
+def test_parse_many_reports_to_metrics_sink():
+    sink = RecordingMetricsSink()
+    factory = FormParseNodeFactory(metrics=sink)
+    factory.parse_many(FORM_CONTENT_TYPE, [b"officeLocation=a", b"officeLocation=b"], TestEntity)
+    assert len(sink.values(form_metrics.PARSE_DURATION, type="TestEntity")) == 2
+
+
+def test_parse_nodes_without_metrics_sink_report_nothing():
+    root = FormParseNodeFactory().get_root_parse_node(FORM_CONTENT_TYPE, b"id=not-a-uuid")
+    assert root.get_object_value(TestEntity).id is None
+
+
+def test_strict_factory_collects_conversion_errors():
+    factory = FormParseNodeFactory(strict=True)
+    root = factory.get_root_parse_node(FORM_CONTENT_TYPE, b"id=1234&officeLocation=Nairobi")
+    root.get_object_value(TestEntity)
+    assert list(root.conversion_errors) == ["id"]
+
+
+def test_strict_parse_many_returns_conversion_errors_in_place():
+    factory = FormParseNodeFactory(strict=True)
+    results = factory.parse_many(
+        FORM_CONTENT_TYPE, [b"officeLocation=a", b"id=1234&birthDay=soon"], TestEntity
+    )
+    assert results[0].office_location == "a"
+    assert isinstance(results[1], FormConversionError)
+    assert list(results[1].errors) == ["id", "birthDay"]
+    assert str(results[1]) == "Invalid values for fields: id, birthDay"
+
+
+def test_strict_parse_many_returns_conversion_errors_in_place_on_a_process_pool():
+    factory = FormParseNodeFactory(strict=True)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        results = factory.parse_many(
+            FORM_CONTENT_TYPE, [b"officeLocation=a", b"id=1234&birthDay=soon"],
+            TestEntity,
+            executor=executor
+        )
+    assert results[0].office_location == "a"
+    assert isinstance(results[1], FormConversionError)
+    assert list(results[1].errors) == ["id", "birthDay"]
+    assert all(isinstance(error, ValueError) for error in results[1].errors.values())
+    assert str(results[1]) == "Invalid values for fields: id, birthDay"
+
+
+def test_projecting_factory_reports_unknown_fields():
+    policy = CountUnknownFields()
+    factory = FormParseNodeFactory(projection=True, unknown_fields=policy)
+    root = factory.get_root_parse_node(FORM_CONTENT_TYPE, b"officeLocation=a&jobTitle=Auditor")
+    assert root.get_object_value(TestEntity).additional_data == {}
+    results = factory.parse_many(
+        FORM_CONTENT_TYPE, [b"jobTitle=Auditor&mail=b", b"officeLocation=c"], TestEntity
+    )
+    assert [result.additional_data for result in results] == [{}, {}]
+    assert results[1].office_location == "c"
+    assert policy.counts == {("TestEntity", "jobTitle"): 2, ("TestEntity", "mail"): 1}
+
+
+def test_parse_nodes_use_the_binary_encoding():
+    factory = FormParseNodeFactory(binary_encoding=FormBinaryEncoding.BASE64URL)
+    root = factory.get_root_parse_node(FORM_CONTENT_TYPE, b"name=a&file=-__-")
+    assert root.get_child_node("file").get_bytes_value() == b"\xfb\xff\xfe"
@@ -1,9 +1,15 @@
+from enum import IntEnum
 from uuid import UUID
-from urllib.parse import unquote_plus
+from urllib.parse import quote_plus, unquote_plus
 import pytest
+from kiota_abstractions.serialization import Parsable
 
 import pendulum
 from datetime import datetime, timedelta, date, time
+from kiota_serialization_form.form_additional_data import LazyAdditionalData
+from kiota_serialization_form.form_binary_encoding import FormBinaryEncoding
+from kiota_serialization_form.form_parse_node import FormParseNode
+from kiota_serialization_form import form_serialization_writer as writer_module
 from kiota_serialization_form.form_serialization_writer import FormSerializationWriter
 from ..helpers import TestEntity, TestEnum
 
@@ -37,6 +43,23 @@ def test_write_str_value():
     assert content_string == "displayName=Adele+Vance"
 
 
+@pytest.mark.parametrize(
+    "key, value", [
+        ("displayName", "AdeleVance_1.0-~"),
+        (" display name ", " Adele Vance "),
+        ("query", "a+b=c&d/e:f,%g#h?i"),
+        ("naïve", "Zürich € 東京"),
+        ("control", "tab\there\x00\x7f"),
+    ]
+)
+def test_write_str_value_encodes_like_quote_plus(key, value):
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.write_str_value(key, value)
+    form_serialization_writer.write_str_value(key, value)
+    field = f"{quote_plus(key.strip())}={quote_plus(value.strip())}"
+    assert form_serialization_writer.get_serialized_content() == f"{field}&{field}".encode()
+
+
 def test_write_bool_value():
     form_serialization_writer = FormSerializationWriter()
     form_serialization_writer.write_bool_value("isActive", False)
@@ -191,3 +214,265 @@ def test_write_object_value(user_1):
         "floatValue=3.14"
     )
 
+
+def test_writer_view_matches_serialized_content():
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.write_str_value("displayName", "Adele Vance")
+    form_serialization_writer.write_int_value("count", 3)
+    assert form_serialization_writer.writer == "displayName=Adele+Vance&count=3"
+    assert form_serialization_writer.get_serialized_content() == b"displayName=Adele+Vance&count=3"
+
+
+def test_writer_view_can_be_assigned():
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.writer = "displayName=Adele+Vance"
+    form_serialization_writer.write_int_value("count", 3)
+    assert form_serialization_writer.get_serialized_content() == b"displayName=Adele+Vance&count=3"
+
+
+def test_write_non_parsable_object_value():
+    class Point:
+        def __init__(self):
+            self.x = 1
+            self.label = "a b"
+
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.write_non_parsable_object_value("point", Point())
+    content = form_serialization_writer.get_serialized_content()
+    assert content == b"point=x=1&label=a+b"
+
+
+def test_write_any_value_resolves_subclasses():
+    class Level(IntEnum):
+        High = 3
+
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.write_any_value(
+        "createdDateTime", pendulum.datetime(2022, 1, 27, 12, 59, 45)
+    )
+    form_serialization_writer.write_any_value("birthDay", pendulum.date(2000, 9, 4))
+    form_serialization_writer.write_any_value("level", Level.High)
+    form_serialization_writer.write_any_value("number", TestEnum.Four)
+    content = form_serialization_writer.get_serialized_content()
+    assert content == (
+        b"createdDateTime=2022-01-27T12%3A59%3A45%2B00%3A00&"
+        b"birthDay=2000-09-04&"
+        b"level=3&"
+        b"number=four"
+    )
+
+
+def test_write_collection_of_primitive_values_resolves_subclasses():
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.write_collection_of_primitive_values(
+        "dates", [pendulum.date(2000, 9, 4), date(2000, 9, 5), True]
+    )
+    content = form_serialization_writer.get_serialized_content()
+    assert content == b"dates=2000-09-04&dates=2000-09-05&dates=true"
+
+
+def test_iter_serialized_content(user_1):
+    buffered_writer = FormSerializationWriter()
+    buffered_writer.write_object_value("user", user_1)
+    streamed_writer = FormSerializationWriter()
+    streamed_writer.write_object_value("user", user_1)
+    chunks = list(streamed_writer.iter_serialized_content(chunk_size=16))
+    assert all(len(chunk) <= 16 for chunk in chunks)
+    assert b"".join(chunks) == buffered_writer.get_serialized_content()
+    assert streamed_writer.get_serialized_content() == b""
+
+
+def test_iter_serialized_content_while_writing():
+    form_serialization_writer = FormSerializationWriter()
+    chunks = []
+    for i in range(3):
+        form_serialization_writer.write_str_value(f"field{i}", f"value {i}")
+        chunks.extend(form_serialization_writer.iter_serialized_content())
+    assert b"".join(chunks) == b"field0=value+0&field1=value+1&field2=value+2"
+
+
+def test_iter_serialized_content_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        FormSerializationWriter().iter_serialized_content(chunk_size=0)
+
+
+class _NestingModel(Parsable):
+    """Writes a value and the model it holds, if any"""
+
+    def __init__(self, value, inner=None):
+        self.value = value
+        self.inner = inner
+
+    def get_field_deserializers(self):
+        return {}
+
+    def serialize(self, writer):
+        writer.write_str_value("value", self.value)
+        writer.write_object_value("inner", self.inner)
+
+
+def test_write_object_value_writes_fields_into_the_content(user_1):
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.write_str_value("before", "a")
+    form_serialization_writer.write_object_value("user", user_1)
+    form_serialization_writer.write_str_value("after", "b")
+    expected = FormSerializationWriter()
+    expected.write_object_value("user", user_1)
+    assert form_serialization_writer.get_serialized_content() == (
+        b"before=a&" + expected.get_serialized_content() + b"&after=b"
+    )
+    assert form_serialization_writer._spare_writer is None
+
+
+def test_write_object_value_writes_models_written_by_models():
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.write_object_value(
+        "outer", _NestingModel("1", _NestingModel("2", _NestingModel("3")))
+    )
+    form_serialization_writer.write_str_value("after", "b")
+    assert form_serialization_writer.get_serialized_content() == (
+        b"outer=value=1&inner=value=2&inner=value=3&inner=&after=b"
+    )
+
+
+def test_iter_serialized_content_between_models(user_1):
+    expected = FormSerializationWriter()
+    form_serialization_writer = FormSerializationWriter()
+    chunks = []
+    for writer in (expected, form_serialization_writer):
+        writer.write_object_value("user", user_1)
+        chunks.extend(form_serialization_writer.iter_serialized_content(chunk_size=7))
+        writer.write_object_value("user", user_1)
+    chunks.extend(form_serialization_writer.iter_serialized_content(chunk_size=7))
+    assert b"".join(chunks) == expected.get_serialized_content()
+
+
+def test_write_object_value_reuses_nested_writer(user_1):
+    expected = FormSerializationWriter()
+    expected.write_object_value("user", user_1)
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.write_object_value("user", user_1)
+    form_serialization_writer.write_object_value("user", user_1)
+    content = expected.get_serialized_content()
+    assert form_serialization_writer.get_serialized_content() == content + b"&" + content
+
+
+def test_reset(user_1):
+    calls = []
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.on_before_object_serialization = calls.append
+    form_serialization_writer.write_object_value(None, user_1)
+    form_serialization_writer.reset()
+    assert form_serialization_writer.get_serialized_content() == b""
+    assert form_serialization_writer.on_before_object_serialization is None
+    form_serialization_writer.write_object_value(None, user_1)
+    expected = FormSerializationWriter()
+    expected.write_object_value(None, user_1)
+    assert form_serialization_writer.get_serialized_content() == expected.get_serialized_content()
+    assert calls == [user_1]
+
+
+def test_write_lazy_additional_data_round_trips():
+    content = b"officeLocation=Nairobi&jobTitle=Auditor&since=2017-09-04&tags=a,b"
+    user = FormParseNode(content, lazy_additional_data=True).get_object_value(TestEntity)
+    assert isinstance(user.additional_data, LazyAdditionalData)
+    form_serialization_writer = FormSerializationWriter()
+    form_serialization_writer.write_additional_data_value(user.additional_data)
+    assert form_serialization_writer.get_serialized_content() == (
+        b"jobTitle=Auditor&since=2017-09-04T00%3A00%3A00%2B00%3A00&tags=a%2Cb"
+    )
+
+
+class _ConditionalModel(Parsable):
+    """Writes its keys only when they have values, in reverse order when reversed is set"""
+
+    def __init__(self, values, reversed_order=False):
+        self.values = values
+        self.reversed_order = reversed_order
+
+    def get_field_deserializers(self):
+        return {}
+
+    def serialize(self, writer):
+        keys = ["grant_type", "client id", "scope", "code"]
+        for key in reversed(keys) if self.reversed_order else keys:
+            writer.write_str_value(key, self.values.get(key))
+        writer.write_collection_of_primitive_values("tags", self.values.get("tags"))
+        writer.write_additional_data_value(self.values.get("extra", {}))
+
+
+def _write_without_shape(value):
+    writer = FormSerializationWriter()
+    value.serialize(writer)
+    return b"=" + writer.get_serialized_content()
+
+
+@pytest.fixture
+def conditional_models():
+    writer_module._key_shapes.pop(_ConditionalModel, None)
+    yield [
+        _ConditionalModel({"scope": "mail.read offline_access"}),
+        _ConditionalModel({
+            "grant_type": "code",
+            "client id": "a",
+            "scope": "b",
+            "code": "c",
+            "tags": ["x", "y", "z"]
+        }),
+        _ConditionalModel({"code": "c", "grant_type": "code", "tags": ["x"]}, reversed_order=True),
+        _ConditionalModel({"client id": "a", "extra": {"client_secret": "s p", "scope": "d"}}),
+        _ConditionalModel({}),
+    ]
+    writer_module._key_shapes.pop(_ConditionalModel, None)
+
+
+def test_key_shape_is_recorded_on_first_serialization(conditional_models):
+    writer = FormSerializationWriter()
+    writer.write_object_value(None, conditional_models[1])
+    shape = writer_module._key_shapes[_ConditionalModel]
+    assert shape.keys == ["grant_type", "client id", "scope", "code", "tags", "tags", "tags"]
+    assert shape.prefixes[1] == b"&client+id="
+
+
+def test_key_shape_writes_conditional_and_reordered_keys(conditional_models):
+    for shape_model in conditional_models:
+        writer_module._key_shapes.pop(_ConditionalModel, None)
+        writer = FormSerializationWriter()
+        writer.write_object_value(None, shape_model)
+        for model in conditional_models:
+            writer.reset()
+            writer.write_object_value(None, model)
+            assert writer.get_serialized_content() == _write_without_shape(model)
+
+
+def test_key_shape_keeps_a_bounded_number_of_keys(conditional_models):
+    extra = {f"key{i}": str(i) for i in range(300)}
+    writer = FormSerializationWriter()
+    writer.write_object_value(None, _ConditionalModel({"extra": extra}))
+    assert len(writer_module._key_shapes[_ConditionalModel].keys) == 256
+    writer.reset()
+    writer.write_object_value(None, _ConditionalModel({"code": "c", "extra": extra}))
+    assert writer.get_serialized_content() == _write_without_shape(
+        _ConditionalModel({"code": "c", "extra": extra})
+    )
+
+
+def test_write_bytes_value_base64url():
+    form_serialization_writer = FormSerializationWriter(binary_encoding=FormBinaryEncoding.BASE64URL)
+    form_serialization_writer.write_bytes_value("message", b"Hello world")
+    form_serialization_writer.write_bytes_value("binary", memoryview(b"\xfb\xff\xfe"))
+    form_serialization_writer.write_bytes_value("empty", b"")
+    assert form_serialization_writer.get_serialized_content() == (
+        b"message=SGVsbG8gd29ybGQ&binary=-__-"
+    )
+
+
+def test_write_large_bytes_value_base64url_round_trips():
+    value = bytes(range(256)) * 20_000
+    form_serialization_writer = FormSerializationWriter(binary_encoding=FormBinaryEncoding.BASE64URL)
+    form_serialization_writer.write_str_value("name", "a b")
+    form_serialization_writer.write_bytes_value("attachment", value)
+    content = form_serialization_writer.get_serialized_content()
+    assert content.startswith(b"name=a+b&attachment=")
+    node = FormParseNode(content, binary_encoding=FormBinaryEncoding.BASE64URL)
+    assert node.get_child_node("attachment").get_bytes_value() == value
@@ -1,10 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
 import pytest
 
+from kiota_serialization_form import form_metrics
+from kiota_serialization_form.form_binary_encoding import FormBinaryEncoding
 from kiota_serialization_form.form_serialization_writer import FormSerializationWriter
 from kiota_serialization_form.form_serialization_writer_factory import (
     FormSerializationWriterFactory,
 )
 
+from ..helpers import RecordingMetricsSink, TestEntity
+
 FORM_CONTENT_TYPE = 'application/x-www-form-urlencoded'
 def test_get_serialization_writer():
     factory = FormSerializationWriterFactory()
@@ -29,4 +36,119 @@ def test_get_serialization_writer_unsupported_content_type():
 def test_get_valid_content_type():
     factory = FormSerializationWriterFactory()
     content_type = factory.get_valid_content_type()
-    assert content_type == FORM_CONTENT_TYPE
\ No newline at end of file
+    assert content_type == FORM_CONTENT_TYPE
+
+def _entities():
+    return [TestEntity(office_location=f"Office {i}", device_names=[f"d{i}"]) for i in range(5)]
+
+
+def _expected(entities):
+    contents = []
+    for entity in entities:
+        writer = FormSerializationWriter()
+        writer.write_object_value(None, entity)
+        contents.append(writer.get_serialized_content())
+    return contents
+
+
+def test_serialize_many():
+    factory = FormSerializationWriterFactory()
+    entities = _entities()
+    result = list(factory.serialize_many(FORM_CONTENT_TYPE, entities, batch_size=2))
+    assert result == _expected(entities)
+
+
+def test_serialize_many_with_executor():
+    factory = FormSerializationWriterFactory()
+    entities = _entities()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = list(
+            factory.serialize_many(FORM_CONTENT_TYPE, entities, executor=executor, batch_size=2)
+        )
+    assert result == _expected(entities)
+
+
+def test_serialize_many_unsupported_content_type():
+    with pytest.raises(TypeError):
+        FormSerializationWriterFactory().serialize_many('application/xml', _entities())
+
+
+def test_get_serialization_writer_from_pool():
+    factory = FormSerializationWriterFactory(pool_size=1)
+    writer = factory.get_serialization_writer(FORM_CONTENT_TYPE)
+    writer.on_after_object_serialization = print
+    writer.write_str_value("displayName", "Adele Vance")
+    factory.release_serialization_writer(writer)
+    pooled_writer = factory.get_serialization_writer(FORM_CONTENT_TYPE)
+    assert pooled_writer is writer
+    assert pooled_writer.get_serialized_content() == b""
+    assert pooled_writer.on_after_object_serialization is None
+    assert factory.get_serialization_writer(FORM_CONTENT_TYPE) is not writer
+
+
+def test_release_serialization_writer_without_pool():
+    factory = FormSerializationWriterFactory()
+    writer = factory.get_serialization_writer(FORM_CONTENT_TYPE)
+    factory.release_serialization_writer(writer)
+    assert factory.get_serialization_writer(FORM_CONTENT_TYPE) is not writer
+
+
+@pytest.mark.parametrize(
+    "writer", [
+        FormSerializationWriter(metrics=RecordingMetricsSink()),
+        FormSerializationWriter(binary_encoding=FormBinaryEncoding.BASE64URL),
+        FormSerializationWriterFactory(
+            binary_encoding=FormBinaryEncoding.BASE64URL
+        ).get_serialization_writer(FORM_CONTENT_TYPE),
+    ]
+)
+def test_writers_with_other_settings_are_not_pooled(writer):
+    factory = FormSerializationWriterFactory(pool_size=1)
+    writer.write_str_value("displayName", "Adele Vance")
+    factory.release_serialization_writer(writer)
+    assert factory.get_serialization_writer(FORM_CONTENT_TYPE) is not writer
+    assert writer.get_serialized_content() == b"displayName=Adele+Vance"
+
+
+def test_writers_with_the_same_settings_are_pooled():
+    factory = FormSerializationWriterFactory(pool_size=1)
+    writer = FormSerializationWriter()
+    factory.release_serialization_writer(writer)
+    assert factory.get_serialization_writer(FORM_CONTENT_TYPE) is writer
+
+
+def test_negative_pool_size():
+    with pytest.raises(ValueError):
+        FormSerializationWriterFactory(pool_size=-1)
+
+
+def test_serialization_writers_report_to_metrics_sink():
+    sink = RecordingMetricsSink()
+    factory = FormSerializationWriterFactory(pool_size=1, metrics=sink)
+    entity = TestEntity()
+    entity.office_location = "Nairobi"
+    entity.work_duration = timedelta(hours=1)
+    writer = factory.get_serialization_writer(FORM_CONTENT_TYPE)
+    writer.write_object_value(None, entity)
+    content = writer.get_serialized_content()
+    factory.release_serialization_writer(writer)
+    # the root model is written after an empty key
+    assert sink.values(form_metrics.SERIALIZE_BODY_SIZE, type="TestEntity") == [len(content) - 1]
+    assert sink.values(form_metrics.SERIALIZE_FIELD_COUNT, type="TestEntity") == [2]
+    assert len(sink.values(form_metrics.SERIALIZE_DURATION, type="TestEntity")) == 1
+
+    list(factory.serialize_many(FORM_CONTENT_TYPE, [entity, entity]))
+    assert len(sink.values(form_metrics.SERIALIZE_DURATION, type="TestEntity")) == 3
+
+
+def test_serialization_writers_use_the_binary_encoding():
+    factory = FormSerializationWriterFactory(
+        pool_size=1, binary_encoding=FormBinaryEncoding.BASE64URL
+    )
+    writer = factory.get_serialization_writer(FORM_CONTENT_TYPE)
+    writer.write_bytes_value("file", b"\xfb\xff\xfe")
+    assert writer.get_serialized_content() == b"file=-__-"
+    factory.release_serialization_writer(writer)
+    writer = factory.get_serialization_writer(FORM_CONTENT_TYPE)
+    writer.write_bytes_value("file", b"\xfb\xff\xfe")
+    assert writer.get_serialized_content() == b"file=-__-"
@@ -0,0 +1,31 @@
+import warnings
+
+import pytest
+
+from kiota_serialization_form.form_unknown_fields import CountUnknownFields, WarnOnceUnknownFields
+
+
+def test_count_unknown_fields_counts_per_type_and_field():
+    policy = CountUnknownFields()
+    policy.report("TestEntity", ["jobTitle", "mail"])
+    policy.report("TestEntity", ["jobTitle"])
+    policy.report("User", ["jobTitle"])
+    assert policy.counts[("TestEntity", "jobTitle")] == 2
+    assert policy.counts[("TestEntity", "mail")] == 1
+    assert policy.counts[("User", "jobTitle")] == 1
+
+
+def test_warn_once_unknown_fields_warns_once_per_type_and_field():
+    policy = WarnOnceUnknownFields()
+    with pytest.warns(UserWarning) as records:
+        policy.report("TestEntity", ["jobTitle", "mail"])
+        policy.report("TestEntity", ["jobTitle"])
+        policy.report("User", ["jobTitle"])
+    assert [str(record.message) for record in records] == [
+        "Found additional property jobTitle to deserialize but the model TestEntity doesn't read it",
+        "Found additional property mail to deserialize but the model TestEntity doesn't read it",
+        "Found additional property jobTitle to deserialize but the model User doesn't read it",
+    ]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        policy.report("User", ["jobTitle"])
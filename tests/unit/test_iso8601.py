@@ -0,0 +1,80 @@
+import pendulum
+import pytest
+
+from kiota_serialization_form._iso8601 import (
+    parse_date,
+    parse_datetime,
+    parse_time,
+    parse_timedelta,
+)
+
+CORPUS = [
+    "2017-07-29T03:07:25Z",
+    "2022-01-27T12:59:45.596117",
+    "2022-01-27T12:59:45.5961179+02:00",
+    "2022-01-27T12:59:45+00:00",
+    "2022-01-27T12:59:45-00:00",
+    "2022-01-27 12:59:45-0530",
+    "2022-01-27T12:59:45.12Z",
+    "2022-01-27T12:59",
+    "2022-01-27T23:59:60Z",
+    "2015-04-20",
+    "20220127",
+    "2020-02-30",
+    "2022-13-01",
+    "08:00:00.0000000",
+    "12:59:45.596117",
+    "12:59",
+    "24:00:00",
+    "PT1H",
+    "PT30S",
+    "PT0.5S",
+    "PT0.1234567S",
+    "P1DT2H3M4.5S",
+    "P0D",
+    "P2W",
+    "P1Y",
+    "PT1.5H",
+    "P",
+    "PT",
+    "P1DT",
+    "-PT1H",
+    "not a date",
+    "P9999999999D",
+    "PT99999999999999H",
+    "P999999999DT99999999999H",
+]
+
+
+def _pendulum_parse(value, expected_type):
+    try:
+        result = pendulum.parse(value, exact=True)
+    except Exception:
+        return None
+    if not isinstance(result, expected_type):
+        return None
+    if isinstance(result, pendulum.Duration):
+        return result.as_timedelta()
+    return result
+
+
+@pytest.mark.parametrize("value", CORPUS)
+@pytest.mark.parametrize(
+    "parse, expected_type", [
+        (parse_datetime, pendulum.DateTime),
+        (parse_date, pendulum.Date),
+        (parse_time, pendulum.Time),
+        (parse_timedelta, pendulum.Duration),
+    ]
+)
+def test_matches_pendulum(value, parse, expected_type):
+    result = parse(value)
+    expected = _pendulum_parse(value, expected_type)
+    assert result == expected
+    assert type(result) is type(expected)
+    assert repr(getattr(result, "tzinfo", None)) == repr(getattr(expected, "tzinfo", None))
+
+
+@pytest.mark.parametrize("value", ["P9999999999D", "P999999999DT99999999999H"])
+def test_parse_timedelta_returns_none_for_durations_out_of_range(value):
+    assert parse_timedelta(value) is None